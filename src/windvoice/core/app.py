@@ -315,9 +315,9 @@ class WindVoiceApp:
         if self.audio_recorder:
             self.audio_recorder.cleanup_temp_files()
         
-        # Hide status dialog
+        # Destroy status dialog
         if self.status_dialog:
-            self.status_dialog.hide()
+            self.status_dialog.destroy()
         
         # Close UI root window
         if self.root_window:
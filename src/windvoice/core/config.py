@@ -39,6 +39,7 @@ class ConfigManager:
     def __init__(self):
         self.config_dir = Path.home() / ".windvoice"
         self.config_file = self.config_dir / "config.toml"
+        self.setup_marker_file = self.config_dir / ".setup_completed"
         self._config: Optional[WindVoiceConfig] = None
     
     @property
@@ -100,7 +101,8 @@ class ConfigManager:
         with open(self.config_file, "wb") as f:
             tomli_w.dump(default_config, f)
 
-    def save_config(self, config: WindVoiceConfig):
+    def save_config(self, config: WindVoiceConfig, mark_completed: bool = False):
+        """Write the config file atomically; optionally also drop the setup-completed marker"""
         self.ensure_config_dir()
         
         config_data = {
@@ -122,11 +124,25 @@ class ConfigManager:
             }
         }
 
-        with open(self.config_file, "wb") as f:
-            tomli_w.dump(config_data, f)
+        # Write to a sibling file and swap it in, so a failed write never leaves a truncated config
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                tomli_w.dump(config_data, f)
+            os.replace(tmp_file, self.config_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+        
+        if mark_completed:
+            self.mark_setup_completed()
         
         self._config = config
 
+    def mark_setup_completed(self):
+        """Create the marker that tells the app first-time setup is done"""
+        self.setup_marker_file.touch()
+
     def validate_config(self) -> bool:
         config = self.load_config()
         
@@ -1,6 +1,8 @@
 import pystray
 from PIL import Image, ImageDraw
 from typing import Callable, Optional
+from functools import lru_cache
+import math
 import threading
 import asyncio
 import time
@@ -8,7 +10,50 @@ from ..core.exceptions import WindVoiceError
 from ..utils.logging import get_logger
 
 
+# Precomputed icon geometry, indexed per frame instead of calling trig on every redraw
+# Inner-circle pulse: one full sine period of 0.3 rad/frame (~21 frames)
+_PULSE_INTENSITIES = tuple(int(128 + 127 * math.sin(i * 0.3)) for i in range(round(2 * math.pi / 0.3)))
+# Unit (cos, sin) for the level bars, 45 degrees apart
+_LEVEL_BAR_DIRECTIONS = tuple((math.cos(math.radians(i * 45)), math.sin(math.radians(i * 45))) for i in range(5))
+# Idle icon triangle, radius 15 around the centre, pointing up
+_IDLE_TRIANGLE = tuple(
+    (32 + 15 * math.cos(math.radians(angle - 90)), 32 + 15 * math.sin(math.radians(angle - 90)))
+    for angle in range(0, 360, 120)
+)
+
+
+@lru_cache(maxsize=None)
+def _recording_base_frame(pulse_index: int) -> Image.Image:
+    """Level-independent part of a recording icon frame: pulsing inner circle and microphone"""
+    width, height = 64, 64
+    image = Image.new('RGBA', (width, height), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(image)
+    
+    # Inner circle pulses
+    pulse_intensity = _PULSE_INTENSITIES[pulse_index]
+    inner_color = (255, pulse_intensity//2, pulse_intensity//2, 255)
+    draw.ellipse([12, 12, width-12, height-12], fill=inner_color)
+    
+    # Microphone icon
+    mic_width = 8
+    mic_height = 12
+    mic_x = 32 - mic_width//2
+    mic_y = 32 - mic_height//2
+    
+    # Mic body
+    draw.rectangle([mic_x, mic_y, mic_x + mic_width, mic_y + mic_height], 
+                 fill=(255, 255, 255, 255), outline=(0, 0, 0, 255))
+    
+    # Mic base
+    draw.rectangle([mic_x - 2, mic_y + mic_height, mic_x + mic_width + 2, mic_y + mic_height + 3], 
+                 fill=(255, 255, 255, 255))
+    
+    return image
+
+
 class SystemTrayService:
+    ANIMATION_INTERVAL = 0.1  # Seconds per recording animation frame
+    
     def __init__(self, on_settings: Optional[Callable] = None, on_quit: Optional[Callable] = None):
         self.logger = get_logger("system_tray")
         self.on_settings = on_settings
@@ -19,70 +64,57 @@ class SystemTrayService:
         
         # Visual feedback for recording
         self.animation_timer: Optional[threading.Timer] = None
-        self.animation_frame = 0
+        self.animation_start = time.monotonic()  # Pulse phase is derived from elapsed time
         self.recording_level = 0.0
         
+        # The idle icon never changes, so it is drawn once and reused
+        self._idle_icon: Optional[Image.Image] = None
+        
     def create_icon_image(self, recording: bool = False, level: float = 0.0) -> Image.Image:
+        if not recording:
+            if self._idle_icon is None:
+                self._idle_icon = self._draw_idle_icon()
+            return self._idle_icon
+        
+        width, height = 64, 64
+        
+        # Animated recording indicator with level visualization
+        # Phase follows wall-clock time, so late or skipped timer ticks don't stretch the pulse
+        frame = int((time.monotonic() - self.animation_start) / self.ANIMATION_INTERVAL)
+        # Start from the prerendered pulse frame; only the level-dependent parts are drawn here
+        image = _recording_base_frame(frame % len(_PULSE_INTENSITIES)).copy()
+        draw = ImageDraw.Draw(image)
+        
+        # Outer ring shows level
+        level_intensity = min(255, int(100 + level * 500))  # Scale level to visual intensity
+        ring_color = (level_intensity, 0, 0, 255)
+        draw.ellipse([4, 4, width-4, height-4], outline=ring_color, width=4)
+        
+        # Level bars around microphone
+        if level > 0.05:
+            bar_count = min(5, int(level * 10))
+            for i in range(bar_count):
+                dx, dy = _LEVEL_BAR_DIRECTIONS[i]
+                radius = 25 + i * 2
+                x = 32 + radius * dx
+                y = 32 + radius * dy
+                bar_height = 3 + i
+                draw.ellipse([x-1, y-bar_height//2, x+1, y+bar_height//2], 
+                           fill=(255, 255, 255, 200))
+        
+        return image
+
+    def _draw_idle_icon(self) -> Image.Image:
         width, height = 64, 64
         image = Image.new('RGBA', (width, height), (255, 255, 255, 0))
         draw = ImageDraw.Draw(image)
         
-        if recording:
-            # Animated recording indicator with level visualization
-            import math
-            
-            # Pulsing red circle based on recording level
-            pulse_intensity = int(128 + 127 * math.sin(self.animation_frame * 0.3))
-            level_intensity = min(255, int(100 + level * 500))  # Scale level to visual intensity
-            
-            # Outer ring shows level
-            ring_color = (level_intensity, 0, 0, 255)
-            draw.ellipse([4, 4, width-4, height-4], outline=ring_color, width=4)
-            
-            # Inner circle pulses
-            inner_color = (255, pulse_intensity//2, pulse_intensity//2, 255)
-            draw.ellipse([12, 12, width-12, height-12], fill=inner_color)
-            
-            # Microphone icon
-            mic_width = 8
-            mic_height = 12
-            mic_x = 32 - mic_width//2
-            mic_y = 32 - mic_height//2
-            
-            # Mic body
-            draw.rectangle([mic_x, mic_y, mic_x + mic_width, mic_y + mic_height], 
-                         fill=(255, 255, 255, 255), outline=(0, 0, 0, 255))
-            
-            # Mic base
-            draw.rectangle([mic_x - 2, mic_y + mic_height, mic_x + mic_width + 2, mic_y + mic_height + 3], 
-                         fill=(255, 255, 255, 255))
-            
-            # Level bars around microphone
-            if level > 0.05:
-                bar_count = min(5, int(level * 10))
-                for i in range(bar_count):
-                    angle = i * (360 / 8)
-                    radius = 25 + i * 2
-                    x = 32 + radius * math.cos(math.radians(angle))
-                    y = 32 + radius * math.sin(math.radians(angle))
-                    bar_height = 3 + i
-                    draw.ellipse([x-1, y-bar_height//2, x+1, y+bar_height//2], 
-                               fill=(255, 255, 255, 200))
-                               
-        else:
-            # Normal WindVoice icon
-            draw.ellipse([8, 8, width-8, height-8], fill=(0, 120, 255, 255), outline=(255, 255, 255, 255), width=2)
-            
-            # WindVoice icon - stylized "W" or microphone
-            inner_points = []
-            for angle in range(0, 360, 120):
-                import math
-                x = 32 + 15 * math.cos(math.radians(angle - 90))
-                y = 32 + 15 * math.sin(math.radians(angle - 90))
-                inner_points.append((x, y))
-            draw.polygon(inner_points, fill=(255, 255, 255, 255))
-            
-        self.animation_frame += 1
+        # Normal WindVoice icon
+        draw.ellipse([8, 8, width-8, height-8], fill=(0, 120, 255, 255), outline=(255, 255, 255, 255), width=2)
+        
+        # WindVoice icon - stylized "W" or microphone
+        draw.polygon(_IDLE_TRIANGLE, fill=(255, 255, 255, 255))
+        
         return image
 
     def _setup_menu(self):
@@ -162,14 +194,10 @@ class SystemTrayService:
                 
     def update_recording_level(self, level: float):
         """Update recording level for visual feedback"""
+        # Only store the level; the animation timer picks it up on its next frame,
+        # so level updates never add icon redraws on top of the animation
         if self.recording:
             self.recording_level = level
-            if self.icon:
-                try:
-                    self.icon.icon = self.create_icon_image(True, level)
-                except OSError as e:
-                    # Handle Windows icon handle errors gracefully
-                    print(f"Warning: Icon update failed: {e}")
                 
     def _start_recording_animation(self):
         """Start animated recording feedback"""
@@ -182,12 +210,13 @@ class SystemTrayService:
                     print(f"Warning: Icon update failed: {e}")
                 
                 # Schedule next frame
-                self.animation_timer = threading.Timer(0.1, update_animation)
+                self.animation_timer = threading.Timer(self.ANIMATION_INTERVAL, update_animation)
                 self.animation_timer.start()
                 
         # Start the animation loop
         if self.animation_timer:
             self.animation_timer.cancel()
+        self.animation_start = time.monotonic()
         update_animation()
         
     def _stop_recording_animation(self):
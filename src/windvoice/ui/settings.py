@@ -6,25 +6,82 @@ including LiteLLM API configuration, audio device selection, and diagnostics.
 """
 
 import customtkinter as ctk
-import tkinter as tk
 from tkinter import messagebox, filedialog
 import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Callable
+from typing import Optional, List, Dict, Callable, TYPE_CHECKING
 import threading
 import tempfile
+import queue
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from ..core.config import ConfigManager, WindVoiceConfig
+from ..core.config import ConfigManager, LiteLLMConfig, AppConfig, UIConfig
 from ..core.exceptions import ConfigurationError, AudioError
-from ..services.audio import AudioRecorder
-from ..services.transcription import TranscriptionService
+# Audio/transcription services pull in PortAudio and aiohttp; import them on first use
+if TYPE_CHECKING:
+    from ..services.audio import AudioRecorder
+    from ..services.transcription import TranscriptionService
 from ..utils.logging import get_logger, WindVoiceLogger
 
+# Models always offered in the dropdown, after whatever the API reports
+_FALLBACK_MODELS = (
+    "whisper-1",        # OpenAI Whisper (cheapest, most compatible)
+    "whisper-large-v3", # Latest Whisper large model
+    "whisper-large-v2", # Previous Whisper large model
+    "whisper-medium",   # Medium Whisper model
+    "whisper-small",    # Small Whisper model
+)
+
+
+@lru_cache(maxsize=8)
+def _combine_models(api_models: tuple) -> tuple:
+    """API models followed by the fallbacks, duplicates removed, order preserved"""
+    return tuple(dict.fromkeys([*api_models, *_FALLBACK_MODELS]))
+
+
+# Open a file or folder with the platform's default handler (chosen once at import)
+if sys.platform == "win32":
+    _open_path = os.startfile
+elif sys.platform == "darwin":
+    def _open_path(path: str):
+        subprocess.run(["open", path])
+else:
+    def _open_path(path: str):
+        subprocess.run(["xdg-open", path])
+
 
 class SettingsWindow:
-    def __init__(self, config_manager: ConfigManager, audio_recorder: Optional[AudioRecorder] = None):
+    # Seconds before an API test / models fetch is abandoned
+    API_TIMEOUT_SECONDS = 15
+    # Seconds a diagnostics scan is reused before the filesystem is checked again
+    DIAGNOSTICS_CACHE_SECONDS = 30
+    # Seconds an audio device enumeration is reused
+    DEVICES_CACHE_SECONDS = 5
+    # Worker result polling: start fast (most results arrive within a few hundred ms), back off to the max
+    POLL_MIN_MS = 5
+    POLL_MAX_MS = 250
+    
+    # Settings tabs in display order, mapped to the method that builds each one
+    SECTION_TABS = {
+        "LiteLLM": "_create_litellm_section",
+        "Audio": "_create_audio_section",
+        "Hotkey": "_create_hotkey_section",
+        "Interface": "_create_ui_section",
+        "Diagnostics": "_create_diagnostics_section",
+    }
+    
+    # Shared fonts, created once after the Tk root exists (see _init_fonts)
+    _FONT_WINDOW_TITLE: Optional[ctk.CTkFont] = None
+    _FONT_SECTION_TITLE: Optional[ctk.CTkFont] = None
+    _FONT_HINT: Optional[ctk.CTkFont] = None
+    
+    def __init__(self, config_manager: ConfigManager, audio_recorder: Optional["AudioRecorder"] = None):
         self.logger = get_logger("settings")
         self.logger.info("Settings window initializing...")
         
@@ -52,26 +109,66 @@ class SettingsWindow:
         # Audio testing
         self.available_devices: List[Dict] = []
         self.testing_audio = False
+        self._devices_q: queue.Queue = queue.Queue()
+        self._devices_loading = False
+        self._devices_cache = (0.0, None)  # (monotonic timestamp, last enumeration result)
+        self._executor: Optional[ThreadPoolExecutor] = None  # Blocking device/filesystem work (created lazily)
+        self._device_names: List[str] = []
+        self._device_name_set: set = set()
+        self._default_device_name = "default"
+        self._device_label_to_index: Dict[str, int] = {}  # Combo label -> device index (default label excluded)
+        
+        # Tabs whose widgets have been built (see _build_tab)
+        self._built_tabs: set = set()
         
         # Diagnostic variables
         self.temp_folder_path = Path(tempfile.gettempdir()) / "windvoice"
-        
-        # Thread-safe communication variables
-        self._test_result = None  # Will store {'status': 'success/error/testing', 'message': '...'}
-        self._test_polling = False
-        self._timeout_id = None
-        
-        # Models fetch variables
-        self._models_result = None  # Will store {'status': 'success/error/loading', 'models': [...], 'message': '...'}
-        self._models_polling = False
-        self._models_timeout_id = None
+        self._config_path = config_manager.config_file_path  # Fixed for the manager's lifetime
+        self._temp_folder_created = False
+        self._diag_q: queue.Queue = queue.Queue()
+        self._diag_loading = False  # A scan is in flight and _drain_diag_q is polling for it
+        self._diag_cache = (0.0, None)  # (monotonic timestamp, status text)
+        self._diag_dirty = False  # Something changed while the Diagnostics tab was hidden
+        
+        # In-flight API requests (concurrent.futures.Future); None when idle.
+        # Each future's done-callback only puts it on _api_q; _drain_api_q polls
+        # that from the Tk thread (Tk calls from the loop thread would fail).
+        self._test_future = None
+        self._models_future = None
+        self._api_q: queue.Queue = queue.Queue()
+        self._api_draining = False
+        
+        # Shared background event loop for API calls (started lazily)
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # TranscriptionService reused by Test + Load Models, keyed by credentials
+        self._svc_cache: Dict[tuple, "TranscriptionService"] = {}
+        # Requests currently awaiting each service; evicted services close when this drops to 0
+        self._svc_users: Dict["TranscriptionService", int] = {}
+        
+        # Pending debounced theme change
+        self._theme_after_id = None
+        
+        # Without a shared recorder, build one in the background while the UI is created
+        self._recorder_ready = threading.Event()
+        if self.audio_recorder is None:
+            self._get_executor().submit(self._create_audio_recorder)
+        else:
+            self._recorder_ready.set()
         
     def show(self):
         """Show the settings window"""
         self.logger.info("[UI] Settings window show() called")
         
-        if self.window and self.is_visible:
-            self.logger.info("[UI] Settings window already visible - bringing to front")
+        if self.window is not None:
+            if self.is_visible:
+                self.logger.info("[UI] Settings window already visible - bringing to front")
+            else:
+                # Reuse the hidden window instead of rebuilding the widget tree
+                self.logger.info("[UI] Re-showing existing settings window")
+                self.window.deiconify()
+                self.is_visible = True
+                self.refresh_from_config()
             self.window.lift()
             self.window.focus_force()
             return
@@ -91,6 +188,12 @@ class SettingsWindow:
             self.window.withdraw()
             self.is_visible = False
     
+    def refresh_from_config(self):
+        """Reload configuration so a reused window reflects the saved settings"""
+        self.config = self.config_manager.load_config()
+        if self.window and self.is_visible:
+            self._load_current_settings()
+    
     def _create_window(self):
         """Create the main settings window"""
         # Initialize Tkinter variables here (after root window exists)
@@ -105,6 +208,7 @@ class SettingsWindow:
         self.notifications_var = ctk.BooleanVar()
         
         self.window = ctk.CTkToplevel()
+        self._init_fonts()
         self.window.title("WindVoice Settings")
         self.window.geometry("700x800")
         self.window.resizable(True, True)
@@ -122,80 +226,107 @@ class SettingsWindow:
         # Window close handler
         self.window.protocol("WM_DELETE_WINDOW", self._on_close)
         
-        # Create scrollable frame
-        self.main_frame = ctk.CTkScrollableFrame(self.window)
-        self.main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
         self._create_widgets()
         
+    @classmethod
+    def _init_fonts(cls):
+        """Create the shared fonts on first use instead of once per widget"""
+        if cls._FONT_SECTION_TITLE is None:
+            cls._FONT_WINDOW_TITLE = ctk.CTkFont(size=24, weight="bold")
+            cls._FONT_SECTION_TITLE = ctk.CTkFont(size=16, weight="bold")
+            cls._FONT_HINT = ctk.CTkFont(size=12)
+        
     def _create_widgets(self):
         """Create all UI widgets"""
         # Title
         title_label = ctk.CTkLabel(
-            self.main_frame, 
+            self.window, 
             text="WindVoice Configuration",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=SettingsWindow._FONT_WINDOW_TITLE
         )
-        title_label.pack(pady=(0, 20))
-        
-        # Create sections
-        self._create_litellm_section()
-        self._create_audio_section()
-        self._create_hotkey_section()
-        self._create_ui_section()
-        self._create_diagnostics_section()
+        title_label.pack(pady=(20, 10))
+        
+        # One tab per section; only the first tab is built now, the others on first activation
+        self.main_frame = ctk.CTkTabview(self.window, command=self._on_tab_change)
+        self.main_frame.pack(fill="both", expand=True, padx=20)
+        for tab_name in self.SECTION_TABS:
+            self.main_frame.add(tab_name)
+        self._build_tab(self.main_frame.get())
+        
         self._create_action_buttons()
         
-    def _create_litellm_section(self):
+    def _on_tab_change(self):
+        """Build the newly selected tab the first time it is shown"""
+        tab_name = self.main_frame.get()
+        if tab_name == "Diagnostics" and self._diag_dirty and tab_name in self._built_tabs:
+            self._update_diagnostics_status()
+        self._build_tab(tab_name)
+        
+    def _build_tab(self, tab_name: str):
+        """Create a section's widgets inside its tab, once"""
+        if tab_name in self._built_tabs:
+            return
+        self._built_tabs.add(tab_name)
+        build_section = getattr(self, self.SECTION_TABS[tab_name])
+        build_section(self.main_frame.tab(tab_name))
+        
+    def _labeled_entry(self, parent, text: str, variable, pady=(5, 10), **kwargs) -> ctk.CTkEntry:
+        """Create a field label with a full-width entry below it"""
+        ctk.CTkLabel(parent, text=text).pack(anchor="w", padx=20)
+        entry = ctk.CTkEntry(parent, textvariable=variable, **kwargs)
+        entry.pack(pady=pady, padx=20, fill="x")
+        return entry
+    
+    def _labeled_combo(self, parent, text: str, variable, values: List[str],
+                       pady=(5, 10), fill: bool = True, **kwargs) -> ctk.CTkComboBox:
+        """Create a field label with a combo box below it (full-width or left-aligned)"""
+        ctk.CTkLabel(parent, text=text).pack(anchor="w", padx=20)
+        combo = ctk.CTkComboBox(parent, variable=variable, values=values, **kwargs)
+        if fill:
+            combo.pack(pady=pady, padx=20, fill="x")
+        else:
+            combo.pack(pady=pady, padx=20, anchor="w")
+        return combo
+    
+    def _create_litellm_section(self, parent):
         """Create LiteLLM API configuration section"""
         # Section frame
-        litellm_frame = ctk.CTkFrame(self.main_frame)
-        litellm_frame.pack(fill="x", pady=(0, 20))
+        litellm_frame = ctk.CTkFrame(parent)
+        litellm_frame.pack(fill="both", expand=True)
         
         # Section title
         title = ctk.CTkLabel(
             litellm_frame,
             text="🤖 Thomson Reuters LiteLLM Configuration",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=SettingsWindow._FONT_SECTION_TITLE
         )
         title.pack(pady=(15, 10))
         
         # API Key
-        ctk.CTkLabel(litellm_frame, text="API Key:").pack(anchor="w", padx=20)
-        self.api_key_entry = ctk.CTkEntry(
-            litellm_frame,
-            textvariable=self.api_key_var,
+        self.api_key_entry = self._labeled_entry(
+            litellm_frame, "API Key:", self.api_key_var,
             placeholder_text="sk-your-api-key-here",
             show="*",
             width=400
         )
-        self.api_key_entry.pack(pady=(5, 10), padx=20, fill="x")
         
         # API Base URL
-        ctk.CTkLabel(litellm_frame, text="API Base URL:").pack(anchor="w", padx=20)
-        self.api_base_entry = ctk.CTkEntry(
-            litellm_frame,
-            textvariable=self.api_base_var,
+        self.api_base_entry = self._labeled_entry(
+            litellm_frame, "API Base URL:", self.api_base_var,
             placeholder_text="https://your-litellm-proxy.com",
             width=400
         )
-        self.api_base_entry.pack(pady=(5, 10), padx=20, fill="x")
         
         # Key Alias
-        ctk.CTkLabel(litellm_frame, text="Key Alias (User ID):").pack(anchor="w", padx=20)
-        self.key_alias_entry = ctk.CTkEntry(
-            litellm_frame,
-            textvariable=self.key_alias_var,
+        self.key_alias_entry = self._labeled_entry(
+            litellm_frame, "Key Alias (User ID):", self.key_alias_var,
             placeholder_text="your-username",
             width=400
         )
-        self.key_alias_entry.pack(pady=(5, 10), padx=20, fill="x")
         
         # Voice Model Selection
-        ctk.CTkLabel(litellm_frame, text="Voice Model:").pack(anchor="w", padx=20)
-        self.model_combo = ctk.CTkComboBox(
-            litellm_frame,
-            variable=self.model_var,
+        self.model_combo = self._labeled_combo(
+            litellm_frame, "Voice Model:", self.model_var,
             values=[
                 "whisper-1",        # OpenAI Whisper (cheapest, most compatible)
                 "whisper-large-v3", # Latest Whisper large model
@@ -210,13 +341,12 @@ class SettingsWindow:
             ],
             width=400
         )
-        self.model_combo.pack(pady=(5, 10), padx=20, fill="x")
         
         # Model info label
         model_info = ctk.CTkLabel(
             litellm_frame, 
             text="💡 whisper-1 is recommended (cheapest, most reliable)",
-            font=ctk.CTkFont(size=12),
+            font=SettingsWindow._FONT_HINT,
             text_color="gray"
         )
         model_info.pack(pady=(0, 5), padx=20)
@@ -239,48 +369,43 @@ class SettingsWindow:
         )
         self.test_api_button.pack(pady=(10, 15))
         
-    def _create_audio_section(self):
+    def _create_audio_section(self, parent):
         """Create audio configuration section"""
         # Section frame
-        audio_frame = ctk.CTkFrame(self.main_frame)
-        audio_frame.pack(fill="x", pady=(0, 20))
+        audio_frame = ctk.CTkFrame(parent)
+        audio_frame.pack(fill="both", expand=True)
         
         # Section title
         title = ctk.CTkLabel(
             audio_frame,
             text="🎤 Audio Settings",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=SettingsWindow._FONT_SECTION_TITLE
         )
         title.pack(pady=(15, 10))
         
         # Audio device selection
-        ctk.CTkLabel(audio_frame, text="Audio Device:").pack(anchor="w", padx=20)
-        self.audio_device_combo = ctk.CTkComboBox(
-            audio_frame,
-            variable=self.audio_device_var,
+        self.audio_device_combo = self._labeled_combo(
+            audio_frame, "Audio Device:", self.audio_device_var,
             values=["Loading devices..."],
             width=400
         )
-        self.audio_device_combo.pack(pady=(5, 10), padx=20, fill="x")
         
         # Refresh devices button
         refresh_button = ctk.CTkButton(
             audio_frame,
             text="🔄 Refresh Devices",
-            command=self._refresh_audio_devices,
+            command=self._force_refresh_audio_devices,
             width=150
         )
         refresh_button.pack(pady=(0, 10))
         
         # Sample rate
-        ctk.CTkLabel(audio_frame, text="Sample Rate:").pack(anchor="w", padx=20)
-        self.sample_rate_combo = ctk.CTkComboBox(
-            audio_frame,
-            variable=self.sample_rate_var,
+        self.sample_rate_combo = self._labeled_combo(
+            audio_frame, "Sample Rate:", self.sample_rate_var,
             values=["44100", "48000", "22050", "16000"],
+            fill=False,
             width=200
         )
-        self.sample_rate_combo.pack(pady=(5, 10), padx=20, anchor="w")
         
         # Test microphone button
         self.test_mic_button = ctk.CTkButton(
@@ -291,25 +416,26 @@ class SettingsWindow:
         )
         self.test_mic_button.pack(pady=(10, 15))
         
-    def _create_hotkey_section(self):
+        # Start loading devices in the background; the combo shows a placeholder until then
+        self._refresh_audio_devices()
+        
+    def _create_hotkey_section(self, parent):
         """Create hotkey configuration section"""
         # Section frame
-        hotkey_frame = ctk.CTkFrame(self.main_frame)
-        hotkey_frame.pack(fill="x", pady=(0, 20))
+        hotkey_frame = ctk.CTkFrame(parent)
+        hotkey_frame.pack(fill="both", expand=True)
         
         # Section title
         title = ctk.CTkLabel(
             hotkey_frame,
             text="⌨️ Hotkey Settings",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=SettingsWindow._FONT_SECTION_TITLE
         )
         title.pack(pady=(15, 10))
         
         # Hotkey selection
-        ctk.CTkLabel(hotkey_frame, text="Recording Hotkey:").pack(anchor="w", padx=20)
-        self.hotkey_combo = ctk.CTkComboBox(
-            hotkey_frame,
-            variable=self.hotkey_var,
+        self.hotkey_combo = self._labeled_combo(
+            hotkey_frame, "Recording Hotkey:", self.hotkey_var,
             values=[
                 "ctrl+shift+space",
                 "ctrl+alt+space",
@@ -317,34 +443,33 @@ class SettingsWindow:
                 "alt+shift+space",
                 "ctrl+shift+r"
             ],
+            pady=(5, 15),
+            fill=False,
             width=300
         )
-        self.hotkey_combo.pack(pady=(5, 15), padx=20, anchor="w")
         
-    def _create_ui_section(self):
+    def _create_ui_section(self, parent):
         """Create UI preferences section"""
         # Section frame
-        ui_frame = ctk.CTkFrame(self.main_frame)
-        ui_frame.pack(fill="x", pady=(0, 20))
+        ui_frame = ctk.CTkFrame(parent)
+        ui_frame.pack(fill="both", expand=True)
         
         # Section title
         title = ctk.CTkLabel(
             ui_frame,
             text="🎨 Interface Settings",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=SettingsWindow._FONT_SECTION_TITLE
         )
         title.pack(pady=(15, 10))
         
         # Theme selection
-        ctk.CTkLabel(ui_frame, text="Theme:").pack(anchor="w", padx=20)
-        self.theme_combo = ctk.CTkComboBox(
-            ui_frame,
-            variable=self.theme_var,
+        self.theme_combo = self._labeled_combo(
+            ui_frame, "Theme:", self.theme_var,
             values=["dark", "light"],
+            fill=False,
             width=200,
             command=self._on_theme_change
         )
-        self.theme_combo.pack(pady=(5, 10), padx=20, anchor="w")
         
         # Show notifications
         self.notifications_checkbox = ctk.CTkCheckBox(
@@ -354,17 +479,17 @@ class SettingsWindow:
         )
         self.notifications_checkbox.pack(pady=(10, 15), padx=20, anchor="w")
         
-    def _create_diagnostics_section(self):
+    def _create_diagnostics_section(self, parent):
         """Create diagnostics and debugging section"""
         # Section frame
-        diag_frame = ctk.CTkFrame(self.main_frame)
-        diag_frame.pack(fill="x", pady=(0, 20))
+        diag_frame = ctk.CTkFrame(parent)
+        diag_frame.pack(fill="both", expand=True)
         
         # Section title
         title = ctk.CTkLabel(
             diag_frame,
             text="🔧 Diagnostics & Debugging",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=SettingsWindow._FONT_SECTION_TITLE
         )
         title.pack(pady=(15, 10))
         
@@ -412,8 +537,8 @@ class SettingsWindow:
     def _create_action_buttons(self):
         """Create action buttons (Save, Cancel, etc.)"""
         # Button frame
-        button_frame = ctk.CTkFrame(self.main_frame)
-        button_frame.pack(fill="x", pady=20)
+        button_frame = ctk.CTkFrame(self.window)
+        button_frame.pack(fill="x", padx=20, pady=20)
         
         # Buttons
         save_button = ctk.CTkButton(
@@ -442,54 +567,188 @@ class SettingsWindow:
         
     def _load_current_settings(self):
         """Load current configuration into form"""
+        litellm = self.config.litellm
+        app = self.config.app
+        ui = self.config.ui
+        
         # LiteLLM settings
-        self.api_key_var.set(self.config.litellm.api_key or "")
-        self.api_base_var.set(self.config.litellm.api_base or "")
-        self.key_alias_var.set(self.config.litellm.key_alias or "")
-        self.model_var.set(self.config.litellm.model or "whisper-1")
+        self.api_key_var.set(litellm.api_key or "")
+        self.api_base_var.set(litellm.api_base or "")
+        self.key_alias_var.set(litellm.key_alias or "")
+        self.model_var.set(litellm.model or "whisper-1")
         
         # App settings
-        self.hotkey_var.set(self.config.app.hotkey)
-        self.audio_device_var.set(self.config.app.audio_device)
-        self.sample_rate_var.set(str(self.config.app.sample_rate))
+        self.hotkey_var.set(app.hotkey)
+        self.audio_device_var.set(app.audio_device)
+        self.sample_rate_var.set(str(app.sample_rate))
         
         # UI settings
-        self.theme_var.set(self.config.ui.theme)
-        self.notifications_var.set(self.config.ui.show_tray_notifications)
+        self.theme_var.set(ui.theme)
+        self.notifications_var.set(ui.show_tray_notifications)
         
-        # Load audio devices
-        self._refresh_audio_devices()
+        # Re-select the configured device if the device list is already loaded
+        if self._device_names:
+            self._select_configured_device()
         
     def _refresh_audio_devices(self):
-        """Refresh the list of available audio devices"""
+        """Refresh the list of available audio devices without blocking the UI"""
+        if self._devices_loading:
+            return
+        self._devices_loading = True
+        
+        self._clear_queue(self._devices_q)
+        cached_at, cached_result = self._devices_cache
+        if cached_result is not None and time.monotonic() - cached_at < self.DEVICES_CACHE_SECONDS:
+            # Recent enumeration is still good - reuse it
+            self._devices_q.put(cached_result)
+        else:
+            # Device enumeration can take hundreds of ms on Windows - do it in a worker
+            self._get_executor().submit(self._enumerate_audio_devices)
+        self._drain_devices_q()
+    
+    def _force_refresh_audio_devices(self):
+        """Re-enumerate audio devices, ignoring the cached list (Refresh Devices button)"""
+        self._devices_cache = (0.0, None)
+        self._refresh_audio_devices()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool for blocking device/filesystem calls, creating it on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settings-bg")
+        return self._executor
+    
+    def _create_audio_recorder(self):
+        """Construct the AudioRecorder in a worker so PortAudio initializes off the UI thread"""
+        try:
+            from ..services.audio import AudioRecorder
+            self.audio_recorder = AudioRecorder()
+        except Exception as e:
+            self.logger.error("Failed to create AudioRecorder: %s", e)
+        finally:
+            self._recorder_ready.set()
+    
+    def _enumerate_audio_devices(self):
+        """Query audio devices in a worker thread and queue the result"""
         try:
+            self._recorder_ready.wait()
             if not self.audio_recorder:
+                # Background creation failed - retry here so the error reaches the user
+                from ..services.audio import AudioRecorder
                 self.audio_recorder = AudioRecorder()
-                
-            self.available_devices = self.audio_recorder.get_available_devices()
+            
+            devices = self.audio_recorder.get_available_devices()
+            default_device = self.audio_recorder.get_default_input_device()
+            self._devices_q.put({'status': 'success', 'devices': devices, 'default_device': default_device})
+        except Exception as e:
+            self._devices_q.put({'status': 'error', 'message': str(e)})
+    
+    def _drain_devices_q(self, delay_ms: int = POLL_MIN_MS):
+        """Populate the device combo once the worker has queued its result"""
+        try:
+            result = self._devices_q.get_nowait()
+        except queue.Empty:
+            self.window.after(delay_ms, self._drain_devices_q, self._next_poll_delay(delay_ms))
+            return
+        
+        self._devices_loading = False
+        
+        try:
+            if result['status'] != 'success':
+                raise AudioError(result['message'])
+            
+            self._devices_cache = (time.monotonic(), result)
+            self.available_devices = result['devices']
             
             # Get default device name
             default_device_name = "default"
-            default_device = self.audio_recorder.get_default_input_device()
+            default_device = result['default_device']
             if default_device:
                 default_device_name = f"default ({default_device['name']})"
             
-            device_names = [default_device_name] + [f"{dev['name']} (ID: {dev['index']})" for dev in self.available_devices]
+            self._device_label_to_index = {f"{dev['name']} (ID: {dev['index']})": dev['index'] for dev in self.available_devices}
+            device_names = [default_device_name, *self._device_label_to_index]
             
             self.audio_device_combo.configure(values=device_names)
             
-            # Set current device
-            current_device = self.config.app.audio_device
-            if current_device in device_names:
-                self.audio_device_var.set(current_device)
-            elif current_device == "default":
-                self.audio_device_var.set(default_device_name)
-            else:
-                self.audio_device_var.set(default_device_name)
+            self._device_names = device_names
+            self._device_name_set = set(device_names)
+            self._default_device_name = default_device_name
+            self._select_configured_device()
                 
         except Exception as e:
             messagebox.showerror("Audio Error", f"Failed to load audio devices: {e}")
-            
+    
+    def _select_configured_device(self):
+        """Select the configured device in the combo, falling back to the default device"""
+        current_device = self.config.app.audio_device
+        if current_device in self._device_name_set:
+            self.audio_device_var.set(current_device)
+        else:
+            self.audio_device_var.set(self._default_device_name)
+            
+    def _ensure_bg_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the shared background asyncio loop on first use"""
+        if self._bg_loop is None:
+            self._bg_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=self._bg_loop.run_forever,
+                name="SettingsAsyncLoop",
+                daemon=True
+            ).start()
+            self.logger.info("[UI] Background event loop started")
+        return self._bg_loop
+    
+    async def _get_or_create_service(self, api_key: str, api_base: str, key_alias: str) -> "TranscriptionService":
+        """Return the cached TranscriptionService for these credentials (background loop only)"""
+        cache_key = (api_key, api_base, key_alias)
+        service = self._svc_cache.get(cache_key)
+        if service is not None:
+            return service
+        
+        # Credentials changed - release sessions built for the old ones (in-use ones close when done)
+        await self._close_services()
+        
+        self.logger.info("[THREAD] Creating TranscriptionService...")
+        from ..services.transcription import TranscriptionService
+        service = TranscriptionService(LiteLLMConfig(
+            api_key=api_key,
+            api_base=api_base,
+            key_alias=key_alias,
+            model="whisper-1"  # Default model for config validation
+        ))
+        self._svc_cache[cache_key] = service
+        return service
+    
+    @asynccontextmanager
+    async def _use_service(self, api_key: str, api_base: str, key_alias: str):
+        """Borrow the cached service for one request; it is not closed while borrowed"""
+        service = await self._get_or_create_service(api_key, api_base, key_alias)
+        self._svc_users[service] = self._svc_users.get(service, 0) + 1
+        try:
+            yield service
+        finally:
+            self._svc_users[service] -= 1
+            if not self._svc_users[service]:
+                del self._svc_users[service]
+                if service not in self._svc_cache.values():
+                    # Evicted while this request was using it
+                    await self._close_service(service)
+    
+    async def _close_services(self):
+        """Forget all cached TranscriptionService instances, closing those not in use"""
+        services = list(self._svc_cache.values())
+        self._svc_cache.clear()
+        for service in services:
+            if service not in self._svc_users:
+                await self._close_service(service)
+    
+    async def _close_service(self, service: "TranscriptionService"):
+        """Close one TranscriptionService, logging (not raising) failures"""
+        try:
+            await service.close()
+        except Exception as e:
+            self.logger.error("[THREAD] Error closing TranscriptionService: %s", e)
+    
     def _test_api_connection(self):
         """Test the LiteLLM API connection"""
         self.logger.info("[UI] LiteLLM test button clicked")
@@ -500,13 +759,13 @@ class SettingsWindow:
             api_base = self.api_base_var.get() if self.api_base_var else ""
             key_alias = self.key_alias_var.get() if self.key_alias_var else ""
         except Exception as e:
-            self.logger.error(f"[UI] Failed to read API configuration: {e}")
+            self.logger.error("[UI] Failed to read API configuration: %s", e)
             messagebox.showerror("UI Error", f"Failed to read configuration: {e}")
             return
         
-        self.logger.info(f"[UI] Test values - API Base: {api_base}, Key Alias: {key_alias}, API Key: {'***' if api_key else 'EMPTY'}")
+        self.logger.info("[UI] Test values - API Base: %s, Key Alias: %s, API Key: %s", api_base, key_alias, '***' if api_key else 'EMPTY')
         
-        if not all([api_key, api_base, key_alias]):
+        if not (api_key and api_base and key_alias):
             self.logger.warning("[UI] Missing API configuration fields")
             messagebox.showwarning("Missing Information", "Please fill in all LiteLLM API fields before testing.")
             return
@@ -514,114 +773,50 @@ class SettingsWindow:
         self.logger.info("[UI] Starting API test - changing button to Testing...")
         self.test_api_button.configure(text="Testing...", state="disabled")
         
-        # Store values for the background thread
-        self._test_config = {
+        # Snapshot values for the background task (passed in, not shared via self)
+        test_config = {
             'api_key': api_key,
             'api_base': api_base,
             'key_alias': key_alias
         }
         
-        # Initialize test result and start polling
-        self._test_result = {'status': 'testing', 'message': 'Test in progress...'}
-        self._test_polling = True
-        
-        # Start polling for results (every 250ms)
-        self._poll_test_result()
-        
-        # Add timeout fallback in case thread fails
-        self._timeout_id = self.window.after(15000, self._test_timeout_fallback)  # 15 second timeout
+        # Run test on the shared background event loop; completion schedules the UI update
+        self.logger.info("[UI] Submitting API test to background loop")
+        self._test_future = asyncio.run_coroutine_threadsafe(self._run_api_test(test_config), self._ensure_bg_loop())
+        self._test_future.add_done_callback(self._api_q.put)
+        self._start_api_drain()
         
-        # Run test in background thread
-        self.logger.info("[UI] Starting background thread for API test")
-        thread = threading.Thread(target=self._run_api_test, daemon=True)
-        thread.start()
-        self.logger.info("[UI] Background thread started")
-        
-    def _run_api_test(self):
-        """Run API test in background thread"""
-        import asyncio
-        
-        self.logger.info("[THREAD] _run_api_test started in background thread")
+    async def _run_api_test(self, test_config: Dict[str, str]) -> Dict:
+        """Run API test on the background event loop and return the result dict"""
+        started = time.perf_counter()
         
         try:
-            # Use pre-stored configuration from main thread
-            if not hasattr(self, '_test_config') or not self._test_config:
-                self.logger.error("[THREAD] No test configuration available")
-                self._test_result = {'status': 'error', 'message': 'No configuration available for test'}
-                return
-            
-            api_key = self._test_config['api_key']
-            api_base = self._test_config['api_base'] 
-            key_alias = self._test_config['key_alias']
-            
-            self.logger.info(f"[THREAD] Using stored config - API Base: {api_base}, Key Alias: {key_alias}, API Key present: {bool(api_key)}")
-            
-            if not all([api_key, api_base, key_alias]):
-                self.logger.error(f"[THREAD] Missing required fields - API Key: {bool(api_key)}, API Base: {bool(api_base)}, Key Alias: {bool(key_alias)}")
-                self._test_result = {'status': 'error', 'message': 'Missing required configuration fields'}
-                return
-            
-            print(f"\n[LITELLM TEST] Starting connection test...")
-            print(f"API Base: {api_base}")
-            print(f"Key Alias: {key_alias}")
-            print(f"API Key: {api_key[:10]}...{api_key[-4:] if len(api_key) > 14 else '[REDACTED]'}")
-            print("-" * 60)
+            api_key = test_config['api_key']
+            api_base = test_config['api_base'] 
+            key_alias = test_config['key_alias']
             
-            self.logger.info("[THREAD] Creating LiteLLM config for testing...")
+            self.logger.info("[THREAD] API test started - API Base: %s, Key Alias: %s, API Key present: %s", api_base, key_alias, bool(api_key))
             
-            # Create temporary config for testing
-            from ..core.config import LiteLLMConfig
-            test_config = LiteLLMConfig(
-                api_key=api_key,
-                api_base=api_base,
-                key_alias=key_alias,
-                model="whisper-1"
-            )
-            
-            self.logger.info("[THREAD] Creating TranscriptionService...")
-            test_service = TranscriptionService(test_config)
-            
-            # Run the async test
-            try:
-                self.logger.info("[THREAD] Setting up asyncio event loop...")
-                # Create new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                self.logger.info("[THREAD] Running async test_connection()...")
-                success, message = loop.run_until_complete(test_service.test_connection())
-                
-                self.logger.info(f"[THREAD] Test completed - Success: {success}, Message: {message}")
-                
-                # Clean up
-                self.logger.info("[THREAD] Cleaning up async resources...")
-                loop.run_until_complete(test_service.close())
-                loop.close()
-                
-                print(f"\n[TEST RESULT] {'SUCCESS' if success else 'FAILED'}")
-                print(f"Message: {message}")
-                print("-" * 60)
-                
-                if success:
-                    self.logger.info("[THREAD] Test succeeded - updating result")
-                    self._test_result = {'status': 'success', 'message': message}
-                else:
-                    self.logger.info("[THREAD] Test failed - updating result")
-                    self._test_result = {'status': 'error', 'message': message}
-                    
-            except Exception as e:
-                error_msg = f"Test execution failed: {str(e)}"
-                self.logger.error(f"[THREAD] Test execution error: {e}")
-                print(f"[ERROR] {error_msg}")
-                self._test_result = {'status': 'error', 'message': error_msg}
+            if not (api_key and api_base and key_alias):
+                result = {'status': 'error', 'message': 'Missing required configuration fields'}
+            else:
+                async with self._use_service(api_key, api_base, key_alias) as test_service:
+                    # Run the async test
+                    try:
+                        self.logger.debug("[THREAD] Running test_connection()")
+                        success, message = await asyncio.wait_for(test_service.test_connection(), self.API_TIMEOUT_SECONDS)
+                        result = {'status': 'success' if success else 'error', 'message': message}
+                    except asyncio.TimeoutError:
+                        result = {'status': 'timeout', 'message': f"Timed out after {self.API_TIMEOUT_SECONDS}s"}
+                    except Exception as e:
+                        result = {'status': 'error', 'message': f"Test execution failed: {str(e)}"}
             
         except Exception as e:
-            error_msg = f"Test setup failed: {str(e)}"
-            self.logger.error(f"[THREAD] Test setup error: {e}")
-            print(f"[ERROR] {error_msg}")
-            self._test_result = {'status': 'error', 'message': error_msg}
+            result = {'status': 'error', 'message': f"Test setup failed: {str(e)}"}
         
-        self.logger.info("[THREAD] _run_api_test completed")
+        self.logger.info("[THREAD] API test finished - status=%s, duration=%.2fs, message=%s",
+                         result['status'], time.perf_counter() - started, result['message'])
+        return result
     
     def _load_available_models(self):
         """Load available models from LiteLLM API"""
@@ -633,11 +828,11 @@ class SettingsWindow:
             api_base = self.api_base_var.get() if self.api_base_var else ""
             key_alias = self.key_alias_var.get() if self.key_alias_var else ""
         except Exception as e:
-            self.logger.error(f"[UI] Failed to read API configuration: {e}")
+            self.logger.error("[UI] Failed to read API configuration: %s", e)
             messagebox.showerror("UI Error", f"Failed to read configuration: {e}")
             return
         
-        if not all([api_key, api_base, key_alias]):
+        if not (api_key and api_base and key_alias):
             self.logger.warning("[UI] Missing API configuration fields for models")
             messagebox.showwarning("Missing Information", "Please fill in all LiteLLM API fields before loading models.")
             return
@@ -645,168 +840,82 @@ class SettingsWindow:
         self.logger.info("[UI] Starting models fetch - changing button to Loading...")
         self.load_models_button.configure(text="Loading...", state="disabled")
         
-        # Store values for the background thread
-        self._models_config = {
+        # Snapshot values for the background task (passed in, not shared via self)
+        models_config = {
             'api_key': api_key,
             'api_base': api_base,
             'key_alias': key_alias
         }
         
-        # Initialize models result and start polling
-        self._models_result = {'status': 'loading', 'models': [], 'message': 'Loading models...'}
-        self._models_polling = True
-        
-        # Start polling for results (every 250ms)
-        self._poll_models_result()
-        
-        # Add timeout fallback in case thread fails
-        self._models_timeout_id = self.window.after(15000, self._models_timeout_fallback)  # 15 second timeout
-        
-        # Run models fetch in background thread
-        self.logger.info("[UI] Starting background thread for models fetch")
-        thread = threading.Thread(target=self._run_models_fetch, daemon=True)
-        thread.start()
-        self.logger.info("[UI] Background thread started")
+        # Run models fetch on the shared background event loop; completion schedules the UI update
+        self.logger.info("[UI] Submitting models fetch to background loop")
+        self._models_future = asyncio.run_coroutine_threadsafe(self._run_models_fetch(models_config), self._ensure_bg_loop())
+        self._models_future.add_done_callback(self._api_q.put)
+        self._start_api_drain()
     
-    def _run_models_fetch(self):
-        """Run models fetch in background thread"""
-        import asyncio
-        
-        self.logger.info("[THREAD] _run_models_fetch started in background thread")
+    async def _run_models_fetch(self, models_config: Dict[str, str]) -> Dict:
+        """Run models fetch on the background event loop and return the result dict"""
+        started = time.perf_counter()
         
         try:
-            # Use pre-stored configuration from main thread
-            if not hasattr(self, '_models_config') or not self._models_config:
-                self.logger.error("[THREAD] No models config available")
-                self._models_result = {'status': 'error', 'models': [], 'message': 'No configuration available for models fetch'}
-                return
-            
-            api_key = self._models_config['api_key']
-            api_base = self._models_config['api_base'] 
-            key_alias = self._models_config['key_alias']
-            
-            self.logger.info(f"[THREAD] Using stored config for models - API Base: {api_base}, Key Alias: {key_alias}")
+            api_key = models_config['api_key']
+            api_base = models_config['api_base'] 
+            key_alias = models_config['key_alias']
             
-            # Create temporary config for models fetch
-            from ..core.config import LiteLLMConfig
-            test_config = LiteLLMConfig(
-                api_key=api_key,
-                api_base=api_base,
-                key_alias=key_alias,
-                model="whisper-1"  # Default model for config validation
-            )
+            self.logger.info("[THREAD] Models fetch started - API Base: %s, Key Alias: %s", api_base, key_alias)
             
-            self.logger.info("[THREAD] Creating TranscriptionService for models fetch...")
-            test_service = TranscriptionService(test_config)
-            
-            # Run the async models fetch
-            try:
-                self.logger.info("[THREAD] Setting up asyncio event loop for models...")
-                # Create new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                self.logger.info("[THREAD] Running async get_available_models()...")
-                success, models, message = loop.run_until_complete(test_service.get_available_models())
-                
-                self.logger.info(f"[THREAD] Models fetch completed - Success: {success}, Models: {len(models)}, Message: {message}")
-                
-                # Clean up
-                self.logger.info("[THREAD] Cleaning up async resources...")
-                loop.run_until_complete(test_service.close())
-                loop.close()
-                
-                if success and models:
-                    self.logger.info(f"[THREAD] Models fetch succeeded - updating result with {len(models)} models")
-                    self._models_result = {'status': 'success', 'models': models, 'message': message}
-                else:
-                    self.logger.info(f"[THREAD] Models fetch failed or no models - updating result: {message}")
-                    self._models_result = {'status': 'error', 'models': [], 'message': message or 'No models found'}
+            async with self._use_service(api_key, api_base, key_alias) as test_service:
+                # Run the async models fetch
+                try:
+                    self.logger.debug("[THREAD] Running get_available_models()")
+                    success, models, message = await asyncio.wait_for(test_service.get_available_models(), self.API_TIMEOUT_SECONDS)
                     
-            except Exception as e:
-                error_msg = f"Models fetch execution failed: {str(e)}"
-                self.logger.error(f"[THREAD] Models fetch execution error: {e}")
-                self._models_result = {'status': 'error', 'models': [], 'message': error_msg}
+                    if success and models:
+                        result = {'status': 'success', 'models': models, 'message': message}
+                    else:
+                        result = {'status': 'error', 'models': [], 'message': message or 'No models found'}
+                        
+                except asyncio.TimeoutError:
+                    result = {'status': 'timeout', 'models': [], 'message': f"Timed out after {self.API_TIMEOUT_SECONDS}s"}
+                except Exception as e:
+                    result = {'status': 'error', 'models': [], 'message': f"Models fetch execution failed: {str(e)}"}
             
         except Exception as e:
-            error_msg = f"Models fetch setup failed: {str(e)}"
-            self.logger.error(f"[THREAD] Models fetch setup error: {e}")
-            self._models_result = {'status': 'error', 'models': [], 'message': error_msg}
+            result = {'status': 'error', 'models': [], 'message': f"Models fetch setup failed: {str(e)}"}
         
-        self.logger.info("[THREAD] _run_models_fetch completed")
+        self.logger.info("[THREAD] Models fetch finished - status=%s, models=%d, duration=%.2fs, message=%s",
+                         result['status'], len(result['models']), time.perf_counter() - started, result['message'])
+        return result
     
-    def _poll_models_result(self):
-        """Poll for models fetch results from main thread"""
-        if not self._models_polling:
-            return
-        
-        try:
-            if self._models_result and self._models_result['status'] != 'loading':
-                # Models fetch completed - process result
-                result = self._models_result
-                status = result['status'] 
-                models = result['models']
-                message = result['message']
-                
-                self.logger.info(f"[POLL] Models fetch completed with status: {status}, models: {len(models)}, message: {message}")
-                
-                # Stop polling
-                self._models_polling = False
-                
-                # Cancel timeout
-                self._cancel_models_timeout()
-                
-                # Update UI based on result
-                if status == 'success' and models:
-                    self._handle_models_success(models, message)
-                else:
-                    self._handle_models_error(message)
-                
-                # Clear result
-                self._models_result = None
-                
-            else:
-                # Models fetch still in progress - continue polling
-                self.window.after(250, self._poll_models_result)  # Poll every 250ms
-                
-        except Exception as e:
-            self.logger.error(f"[POLL] Error during models polling: {e}")
-            # Stop polling on error
-            self._models_polling = False
+    def _process_models_result(self, future):
+        """Apply a finished models fetch in main thread"""
+        self._models_future = None
+        result = future.result()
+        
+        status = result['status']
+        models = result['models']
+        message = result['message']
+        
+        self.logger.debug("[UI] Models fetch completed with status: %s, models: %s, message: %s", status, len(models), message)
+        
+        if status == 'success' and models:
+            self._handle_models_success(models, message)
+        elif status == 'timeout':
+            self._models_timeout_fallback()
+        else:
+            self._handle_models_error(message)
     
     def _handle_models_success(self, models: list[str], message: str):
         """Handle successful models fetch result in main thread"""
-        self.logger.info(f"[UI] Handling models success: {len(models)} models, message: {message}")
+        self.logger.debug("[UI] Handling models success: %s models, message: %s", len(models), message)
         
         try:
-            # Add default fallback models at the beginning
-            fallback_models = [
-                "whisper-1",        # OpenAI Whisper (cheapest, most compatible)
-                "whisper-large-v3", # Latest Whisper large model
-                "whisper-large-v2", # Previous Whisper large model
-                "whisper-medium",   # Medium Whisper model
-                "whisper-small",    # Small Whisper model
-            ]
-            
             # Combine API models with fallbacks (remove duplicates, preserve order)
-            combined_models = []
-            added_models = set()
-            
-            # Add API models first
-            for model in models:
-                if model not in added_models:
-                    combined_models.append(model)
-                    added_models.add(model)
-            
-            # Add fallback models if not already present
-            for model in fallback_models:
-                if model not in added_models:
-                    combined_models.append(model)
-                    added_models.add(model)
+            combined_models = _combine_models(tuple(models))
             
             # Update the combo box
             current_selection = self.model_var.get()
-            self.model_combo.configure(values=combined_models)
+            self.model_combo.configure(values=list(combined_models))
             
             # Preserve current selection if it's still valid, otherwise default to whisper-1
             if current_selection and current_selection in combined_models:
@@ -816,17 +925,17 @@ class SettingsWindow:
             
             self.load_models_button.configure(text="✅ Models Loaded", state="normal")
             
-            messagebox.showinfo("Models Loaded", f"Successfully loaded {len(models)} models from API!\n\n{message}\n\nThe dropdown now shows available models.")
+            self._show_toast("Models Loaded", f"Successfully loaded {len(models)} models from API!\n\n{message}\n\nThe dropdown now shows available models.")
             
             # Reset button after 3 seconds
             self.window.after(3000, self._reset_models_button)
             
         except Exception as e:
-            self.logger.error(f"[UI] Error handling models success: {e}")
+            self.logger.error("[UI] Error handling models success: %s", e)
     
     def _handle_models_error(self, message: str):
         """Handle failed models fetch result in main thread"""
-        self.logger.info(f"[UI] Handling models error: {message}")
+        self.logger.debug("[UI] Handling models error: %s", message)
         
         try:
             self.load_models_button.configure(text="❌ Load Failed", state="normal")
@@ -837,274 +946,186 @@ class SettingsWindow:
             self.window.after(3000, self._reset_models_button)
             
         except Exception as e:
-            self.logger.error(f"[UI] Error handling models error: {e}")
-    
-    def _cancel_models_timeout(self):
-        """Cancel the models timeout timer"""
-        try:
-            if hasattr(self, '_models_timeout_id') and self._models_timeout_id:
-                self.window.after_cancel(self._models_timeout_id)
-                self._models_timeout_id = None
-                self.logger.info("[UI] Models timeout cancelled")
-        except Exception as e:
-            self.logger.error(f"[UI] Error cancelling models timeout: {e}")
+            self.logger.error("[UI] Error handling models error: %s", e)
     
     def _models_timeout_fallback(self):
         """Fallback to reset button if models fetch takes too long"""
         try:
-            if self._models_polling and self._models_result and self._models_result['status'] == 'loading':
-                self.logger.warning("[UI] Models fetch timeout - stopping fetch")
-                
-                # Stop polling
-                self._models_polling = False
-                
-                # Update button
-                self.load_models_button.configure(text="⏰ Timeout", state="normal")
-                
-                messagebox.showwarning("Models Load Timeout", "The models fetch timed out.\n\nThis may indicate network issues or server problems.\nUsing default model list.")
-                
-                # Reset after showing timeout
-                self.window.after(2000, self._reset_models_button)
-                
-                # Clear result
-                self._models_result = None
-                
+            self.logger.warning("[UI] Models fetch timeout")
+            
+            # Update button
+            self.load_models_button.configure(text="⏰ Timeout", state="normal")
+            
+            messagebox.showwarning("Models Load Timeout", "The models fetch timed out.\n\nThis may indicate network issues or server problems.\nUsing default model list.")
+            
+            # Reset after showing timeout
+            self.window.after(2000, self._reset_models_button)
+            
         except Exception as e:
-            self.logger.error(f"[UI] Error in models timeout fallback: {e}")
+            self.logger.error("[UI] Error in models timeout fallback: %s", e)
     
     def _reset_models_button(self):
         """Reset the load models button to original state"""
         try:
             self.load_models_button.configure(text="🔍 Load Available Models", state="normal")
-            self.logger.info("[UI] Load models button reset to original state")
+            self.logger.debug("[UI] Load models button reset to original state")
         except Exception as e:
-            self.logger.error(f"[UI] Error resetting models button: {e}")
+            self.logger.error("[UI] Error resetting models button: %s", e)
     
-    def _poll_test_result(self):
-        """Poll for test results from main thread - this can safely update UI"""
-        if not self._test_polling:
-            return
-        
-        try:
-            if self._test_result and self._test_result['status'] != 'testing':
-                # Test completed - process result
-                result = self._test_result
-                status = result['status'] 
-                message = result['message']
-                
-                self.logger.info(f"[POLL] Test completed with status: {status}, message: {message}")
-                
-                # Stop polling
-                self._test_polling = False
-                
-                # Cancel timeout
-                self._cancel_timeout()
-                
-                # Update UI based on result
-                if status == 'success':
-                    self._handle_test_success(message)
-                elif status == 'error':
-                    self._handle_test_error(message)
-                
-                # Clear result
-                self._test_result = None
-                
-            else:
-                # Test still in progress - continue polling
-                self.window.after(250, self._poll_test_result)  # Poll every 250ms
-                
-        except Exception as e:
-            self.logger.error(f"[POLL] Error during polling: {e}")
-            # Stop polling on error
-            self._test_polling = False
+    @staticmethod
+    def _cancel_future(future):
+        """Cancel a pending background request, if any"""
+        if future is not None and not future.done():
+            future.cancel()
     
-    def _handle_test_success(self, message: str):
-        """Handle successful test result in main thread"""
-        self.logger.info(f"[UI] Handling test success: {message}")
-        
-        try:
-            self.test_api_button.configure(text="Connection OK", state="normal")
-            print(f"[SUCCESS] LiteLLM Test Success: {message}")
-            messagebox.showinfo("API Test Successful", f"LiteLLM connection test passed!\n\n{message}")
-            
-            # Reset button after 3 seconds
-            self.window.after(3000, self._reset_test_button)
-            
-        except Exception as e:
-            self.logger.error(f"[UI] Error handling success: {e}")
+    @classmethod
+    def _next_poll_delay(cls, delay_ms: int) -> int:
+        """Grow a drain loop's poll interval by 1.5x, capped at POLL_MAX_MS"""
+        return min(cls.POLL_MAX_MS, max(delay_ms + 1, int(delay_ms * 1.5)))
     
-    def _handle_test_error(self, message: str):
-        """Handle failed test result in main thread"""
-        self.logger.info(f"[UI] Handling test error: {message}")
+    @staticmethod
+    def _clear_queue(result_q: queue.Queue):
+        """Drop any stale results left in a result queue"""
+        while True:
+            try:
+                result_q.get_nowait()
+            except queue.Empty:
+                return
+    
+    def _process_test_result(self, future):
+        """Apply a finished API test in main thread - this can safely update UI"""
+        self._test_future = None
+        result = future.result()
         
-        try:
-            self.test_api_button.configure(text="Test Failed", state="normal")
-            print(f"[ERROR] LiteLLM Test Failed: {message}")
-            messagebox.showerror("API Test Failed", f"LiteLLM connection test failed:\n\n{message}\n\nCheck the console for detailed logs.")
-            
-            # Reset button after 5 seconds (longer for errors)
-            self.window.after(5000, self._reset_test_button)
-            
-        except Exception as e:
-            self.logger.error(f"[UI] Error handling error: {e}")
+        status = result['status']
+        message = result['message']
+        
+        self.logger.debug("[UI] Test completed with status: %s, message: %s", status, message)
+        
+        if status == 'timeout':
+            self._test_timeout_fallback()
+        else:
+            self._report_api_test_result(status == 'success', message)
     
-    def _schedule_ui_update(self, callback, *args):
-        """Safely schedule UI update from background thread"""
-        self.logger.info(f"[THREAD] Scheduling UI update - callback: {callback.__name__}, args: {args}")
+    def _report_api_test_result(self, ok: bool, message: str):
+        """Show an API test result on the button, console and a dialog (main thread)"""
+        self.logger.debug("[UI] Reporting test result - ok: %s, message: %s", ok, message)
         
         try:
-            if self.window and self.window.winfo_exists():
-                self.logger.info("[THREAD] Window exists - scheduling callback")
-                if args:
-                    self.window.after(0, lambda: callback(*args))
-                else:
-                    self.window.after(0, callback)
-                self.logger.info("[THREAD] UI update scheduled successfully")
+            if ok:
+                self.test_api_button.configure(text="Connection OK", state="normal")
+                print(f"[SUCCESS] LiteLLM Test Success: {message}")
+                self._show_toast("API Test Successful", f"LiteLLM connection test passed!\n\n{message}")
             else:
-                self.logger.warning("[THREAD] Window does not exist or was destroyed")
-        except (RuntimeError, tk.TclError) as e:
-            self.logger.error(f"[THREAD] Failed to schedule UI update: {e}")
+                self.test_api_button.configure(text="Test Failed", state="normal")
+                print(f"[ERROR] LiteLLM Test Failed: {message}")
+                messagebox.showerror("API Test Failed", f"LiteLLM connection test failed:\n\n{message}\n\nCheck the console for detailed logs.")
+            
+            # Reset button afterwards (longer for errors)
+            self.window.after(3000 if ok else 5000, self._reset_test_button)
+            
         except Exception as e:
-            self.logger.error(f"[THREAD] Unexpected error in _schedule_ui_update: {e}")
+            self.logger.error("[UI] Error reporting test result: %s", e)
     
-    def _safe_ui_update_print(self, message: str):
-        """Print message and try basic console feedback when UI update fails"""
-        print(f"[UI UPDATE] {message}")
-        self.logger.info(f"[THREAD] Safe print: {message}")
+    def _show_toast(self, title: str, message: str, duration_ms: int = 2500):
+        """Show a non-modal message over the settings window that closes itself"""
+        toast = ctk.CTkToplevel(self.window)
+        toast.title(title)
+        toast.resizable(False, False)
+        toast.transient(self.window)
+        
+        ctk.CTkLabel(toast, text=message, font=SettingsWindow._FONT_HINT, justify="left", wraplength=360).pack(padx=20, pady=15)
+        
+        # Center over the settings window
+        toast.update_idletasks()
+        x = self.window.winfo_rootx() + (self.window.winfo_width() - toast.winfo_width()) // 2
+        y = self.window.winfo_rooty() + (self.window.winfo_height() - toast.winfo_height()) // 2
+        toast.geometry(f"+{x}+{y}")
+        
+        toast.after(duration_ms, toast.destroy)
     
-    def _safe_ui_update_success(self, message: str):
-        """Safely update UI for success, with print fallback"""
-        try:
-            self._schedule_ui_update(self._on_api_test_success, message)
-        except Exception as e:
-            self.logger.error(f"[THREAD] UI update failed, using print fallback: {e}")
-            print(f"[SUCCESS] LiteLLM Test Passed: {message}")
-            print("[INFO] Please manually reset the test button if it's stuck")
+    def _start_api_drain(self):
+        """Start polling for API results on the Tk thread unless a drain loop is already running"""
+        if not self._api_draining:
+            self._api_draining = True
+            self._drain_api_q()
     
-    def _safe_ui_update_error(self, message: str):
-        """Safely update UI for error, with print fallback"""
-        try:
-            self._schedule_ui_update(self._on_api_test_error, message)
-        except Exception as e:
-            self.logger.error(f"[THREAD] UI update failed, using print fallback: {e}")
-            print(f"[ERROR] LiteLLM Test Failed: {message}")
-            print("[INFO] Please manually reset the test button if it's stuck")
+    def _drain_api_q(self, delay_ms: int = POLL_MIN_MS):
+        """Apply finished API requests; keeps polling while any request is in flight"""
+        while True:
+            try:
+                future = self._api_q.get_nowait()
+            except queue.Empty:
+                break
+            
+            # Only the request currently tracked for each button is applied;
+            # abandoned (window closed) or superseded ones are dropped here
+            if future.cancelled():
+                continue
+            if future is self._test_future:
+                self._process_test_result(future)
+            elif future is self._models_future:
+                self._process_models_result(future)
+        
+        if self._test_future is None and self._models_future is None:
+            self._api_draining = False
+            return
+        self.window.after(delay_ms, self._drain_api_q, self._next_poll_delay(delay_ms))
     
     def _test_timeout_fallback(self):
         """Fallback to reset button if test takes too long"""
         try:
-            if self._test_polling and self._test_result and self._test_result['status'] == 'testing':
-                self.logger.warning("[UI] Test timeout - stopping test")
-                
-                # Stop polling
-                self._test_polling = False
-                
-                # Update button
-                self.test_api_button.configure(text="Test Timeout", state="normal")
-                print("[TIMEOUT] API test timed out after 15 seconds")
-                
-                # Show error dialog
-                messagebox.showerror("Test Timeout", "The API connection test timed out.\n\nThis may indicate network issues or server problems.")
-                
-                # Reset after showing timeout
-                self.window.after(2000, self._reset_test_button)
-                
-                # Clear result
-                self._test_result = None
-                
-        except Exception as e:
-            self.logger.error(f"[UI] Error in timeout fallback: {e}")
+            self.logger.warning("[UI] Test timeout")
             
-    def _on_api_test_success(self, message: str = "Connection successful"):
-        """Handle successful API test"""
-        self.logger.info(f"[UI] _on_api_test_success called with message: {message}")
-        
-        # Cancel timeout since test completed
-        self._cancel_timeout()
-        
-        try:
-            self.test_api_button.configure(text="Connection OK", state="normal")
-            self.logger.info("[UI] Button updated to success state")
-            
-            print(f"[SUCCESS] LiteLLM Test Success: {message}")
+            # Update button
+            self.test_api_button.configure(text="Test Timeout", state="normal")
+            print(f"[TIMEOUT] API test timed out after {self.API_TIMEOUT_SECONDS} seconds")
             
-            messagebox.showinfo("API Test Successful", f"LiteLLM connection test passed!\n\n{message}")
-            self.logger.info("[UI] Success dialog shown")
+            # Show error dialog
+            messagebox.showerror("Test Timeout", "The API connection test timed out.\n\nThis may indicate network issues or server problems.")
             
-            # Reset button after 3 seconds
-            self.window.after(3000, lambda: self._reset_test_button())
-            self.logger.info("[UI] Button reset scheduled")
+            # Reset after showing timeout
+            self.window.after(2000, self._reset_test_button)
             
         except Exception as e:
-            self.logger.error(f"[UI] Error in _on_api_test_success: {e}")
-        
-    def _on_api_test_error(self, error_message: str):
-        """Handle failed API test"""
-        self.logger.info(f"[UI] _on_api_test_error called with message: {error_message}")
-        
-        # Cancel timeout since test completed
-        self._cancel_timeout()
-        
-        try:
-            self.test_api_button.configure(text="Test Failed", state="normal")
-            self.logger.info("[UI] Button updated to error state")
-            
-            print(f"[FAILED] LiteLLM Test Failed: {error_message}")
+            self.logger.error("[UI] Error in timeout fallback: %s", e)
             
-            messagebox.showerror("API Test Failed", f"LiteLLM connection test failed:\n\n{error_message}\n\nCheck the console for detailed logs.")
-            self.logger.info("[UI] Error dialog shown")
-            
-            # Reset button after 3 seconds
-            self.window.after(3000, lambda: self._reset_test_button())
-            self.logger.info("[UI] Button reset scheduled")
-            
-        except Exception as e:
-            self.logger.error(f"[UI] Error in _on_api_test_error: {e}")
-    
-    def _cancel_timeout(self):
-        """Cancel the timeout timer"""
-        try:
-            if hasattr(self, '_timeout_id') and self._timeout_id:
-                self.window.after_cancel(self._timeout_id)
-                self._timeout_id = None
-                self.logger.info("[UI] Test timeout cancelled")
-        except Exception as e:
-            self.logger.error(f"[UI] Error cancelling timeout: {e}")
-    
     def _reset_test_button(self):
         """Reset the test button to original state"""
         try:
             self.test_api_button.configure(text="Test API Connection", state="normal")
-            self.logger.info("[UI] Test button reset to original state")
+            self.logger.debug("[UI] Test button reset to original state")
         except Exception as e:
-            self.logger.error(f"[UI] Error resetting test button: {e}")
+            self.logger.error("[UI] Error resetting test button: %s", e)
         
     def _test_microphone(self):
         """Test the selected microphone"""
         if self.testing_audio:
             return
+        if not self._recorder_ready.is_set():
+            # The background AudioRecorder construction has not finished yet
+            messagebox.showinfo("Microphone Test", "The audio system is still starting up. Please try again in a moment.")
+            return
             
         try:
             self.testing_audio = True
             self.test_mic_button.configure(text="🔄 Testing...", state="disabled")
             
             # Test the microphone
+            # "default" / "default (device name)" are not in the map, so they test the default device
             device_name = self.audio_device_var.get()
-            device_index = None
+            device_index = self._device_label_to_index.get(device_name)
+            
+            if not self.audio_recorder:
+                # Background creation failed - retry here so the error reaches the user
+                from ..services.audio import AudioRecorder
+                self.audio_recorder = AudioRecorder()
             
-            # Handle both "default" and "default (device name)" formats
-            if not (device_name == "default" or device_name.startswith("default (")):
-                # Find device index
-                for dev in self.available_devices:
-                    if f"{dev['name']} (ID: {dev['index']})" == device_name:
-                        device_index = dev['index']
-                        break
-                        
             success, error_reason = self.audio_recorder.test_device(device_index)
             
             if success:
                 self.test_mic_button.configure(text="✅ Microphone OK")
-                self.window.after(3000, lambda: self._reset_mic_test_button())
+                self.window.after(3000, self._reset_mic_test_button)
             else:
                 if error_reason == "device_busy":
                     self.test_mic_button.configure(text="🔒 Device Busy")
@@ -1112,12 +1133,12 @@ class SettingsWindow:
                 else:
                     self.test_mic_button.configure(text="❌ Test Failed")
                     messagebox.showerror("Microphone Test", "Microphone test failed. Please check your audio device.")
-                self.window.after(3000, lambda: self._reset_mic_test_button())
+                self.window.after(3000, self._reset_mic_test_button)
                 
         except Exception as e:
             self.test_mic_button.configure(text="❌ Error")
             messagebox.showerror("Microphone Error", f"Failed to test microphone: {e}")
-            self.window.after(3000, lambda: self._reset_mic_test_button())
+            self.window.after(3000, self._reset_mic_test_button)
         finally:
             self.testing_audio = False
             
@@ -1128,16 +1149,13 @@ class SettingsWindow:
     def _open_audio_folder(self):
         """Open the temporary audio folder in file explorer"""
         try:
-            # Ensure the folder exists
-            self.temp_folder_path.mkdir(exist_ok=True)
+            # Ensure the folder exists (only needs checking once per session)
+            if not self._temp_folder_created:
+                self.temp_folder_path.mkdir(parents=True, exist_ok=True)
+                self._temp_folder_created = True
             
             # Open in file explorer
-            if sys.platform == "win32":
-                os.startfile(str(self.temp_folder_path))
-            elif sys.platform == "darwin":
-                subprocess.run(["open", str(self.temp_folder_path)])
-            else:
-                subprocess.run(["xdg-open", str(self.temp_folder_path)])
+            _open_path(str(self.temp_folder_path))
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open audio folder: {e}")
@@ -1146,13 +1164,22 @@ class SettingsWindow:
         """Clear temporary audio files"""
         try:
             count = 0
-            for file in self.temp_folder_path.glob("*.wav"):
-                if file.exists():
-                    file.unlink()
-                    count += 1
+            try:
+                with os.scandir(self.temp_folder_path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".wav") and entry.is_file(follow_symlinks=False):
+                            try:
+                                os.unlink(entry.path)
+                                count += 1
+                            except FileNotFoundError:
+                                pass  # Removed by someone else meanwhile
+                # Listing succeeded, so the folder exists
+                self._temp_folder_created = True
+            except FileNotFoundError:
+                pass  # No audio folder yet - nothing to clear
                     
             messagebox.showinfo("Success", f"Cleared {count} temporary audio files.")
-            self._update_diagnostics_status()
+            self._update_diagnostics_status(force=True)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to clear temporary files: {e}")
@@ -1160,113 +1187,162 @@ class SettingsWindow:
     def _show_config_file(self):
         """Open the configuration file in default text editor"""
         try:
-            config_path = self.config_manager.config_file_path
-            
-            if sys.platform == "win32":
-                os.startfile(str(config_path))
-            elif sys.platform == "darwin":
-                subprocess.run(["open", str(config_path)])
-            else:
-                subprocess.run(["xdg-open", str(config_path)])
+            _open_path(str(self._config_path))
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open config file: {e}")
             
-    def _update_diagnostics_status(self):
-        """Update the diagnostics status display"""
+    def _update_diagnostics_status(self, force: bool = False):
+        """Update the diagnostics status display, scanning the filesystem in a worker"""
+        if "Diagnostics" not in self._built_tabs or self.main_frame.get() != "Diagnostics":
+            # Not on screen; rescan when the tab is next shown
+            self._diag_dirty = True
+            return
+        
+        if self._diag_loading:
+            # The running scan may predate this change - rescan once it reports
+            self._diag_dirty = True
+            return
+        
+        force = force or self._diag_dirty
+        self._diag_dirty = False
+        
+        cached_at, cached_text = self._diag_cache
+        if not force and cached_text is not None and time.monotonic() - cached_at < self.DIAGNOSTICS_CACHE_SECONDS:
+            self._show_diagnostics_text(cached_text)
+            return
+        
+        self._diag_loading = True
+        self._clear_queue(self._diag_q)
+        self._get_executor().submit(self._compute_diagnostics_status)
+        self._drain_diag_q()
+    
+    def _compute_diagnostics_status(self):
+        """Build the diagnostics text in a worker thread and queue it"""
         try:
             status_info = []
             
             # Config file status
-            config_path = self.config_manager.config_file_path
+            config_path = self._config_path
             status_info.append(f"Config file: {config_path}")
             status_info.append(f"Config exists: {'Yes' if config_path.exists() else 'No'}")
             
             # Audio folder status
             status_info.append(f"Audio folder: {self.temp_folder_path}")
-            status_info.append(f"Audio folder exists: {'Yes' if self.temp_folder_path.exists() else 'No'}")
-            
-            if self.temp_folder_path.exists():
-                wav_files = list(self.temp_folder_path.glob("*.wav"))
-                status_info.append(f"Temporary audio files: {len(wav_files)}")
+            try:
+                with os.scandir(self.temp_folder_path) as entries:
+                    wav_count = sum(1 for entry in entries if entry.name.endswith(".wav"))
+            except FileNotFoundError:
+                wav_count = None
+            status_info.append(f"Audio folder exists: {'No' if wav_count is None else 'Yes'}")
+            if wav_count is not None:
+                status_info.append(f"Temporary audio files: {wav_count}")
                 
             # API status
-            has_api_config = all([
-                self.config.litellm.api_key,
-                self.config.litellm.api_base,
-                self.config.litellm.key_alias
-            ])
+            litellm = self.config.litellm
+            has_api_config = bool(litellm.api_key and litellm.api_base and litellm.key_alias)
             status_info.append(f"LiteLLM configured: {'Yes' if has_api_config else 'No'}")
             
-            # Update text widget
-            self.status_text.delete("1.0", "end")
-            self.status_text.insert("1.0", "\n".join(status_info))
+            self._diag_q.put("\n".join(status_info))
             
         except Exception as e:
+            self._diag_q.put(f"Error updating status: {e}")
+    
+    def _drain_diag_q(self, delay_ms: int = POLL_MIN_MS):
+        """Show the diagnostics text once the worker has queued it"""
+        try:
+            text = self._diag_q.get_nowait()
+        except queue.Empty:
+            self.window.after(delay_ms, self._drain_diag_q, self._next_poll_delay(delay_ms))
+            return
+        
+        self._diag_loading = False
+        self._diag_cache = (time.monotonic(), text)
+        self._show_diagnostics_text(text)
+        
+        if self._diag_dirty:
+            # Something changed while that scan ran
+            self._update_diagnostics_status()
+    
+    def _show_diagnostics_text(self, text: str):
+        """Replace the contents of the diagnostics text widget"""
+        replace = getattr(self.status_text, "replace", None)
+        if replace is not None:
+            # One Tcl command instead of delete + insert
+            replace("1.0", "end", text)
+        else:
+            # Older CTkTextbox versions do not expose Text.replace
             self.status_text.delete("1.0", "end")
-            self.status_text.insert("1.0", f"Error updating status: {e}")
+            self.status_text.insert("1.0", text)
             
     def _save_settings(self):
         """Save the current settings"""
         try:
-            # Validate required fields
-            if not all([self.api_key_var.get(), self.api_base_var.get(), self.key_alias_var.get()]):
+            # Read and strip each field once, then validate
+            api_key = self.api_key_var.get().strip()
+            api_base = self.api_base_var.get().strip()
+            key_alias = self.key_alias_var.get().strip()
+            
+            if not (api_key and api_base and key_alias):
                 messagebox.showwarning("Missing Information", "Please fill in all LiteLLM API fields.")
                 return
+            
+            try:
+                sample_rate = int(self.sample_rate_var.get())
+            except ValueError:
+                messagebox.showwarning("Invalid Sample Rate", "Sample rate must be a whole number (e.g. 16000).")
+                return
                 
-            # Update config object
-            self.config.litellm.api_key = self.api_key_var.get().strip()
-            self.config.litellm.api_base = self.api_base_var.get().strip()
-            self.config.litellm.key_alias = self.key_alias_var.get().strip()
-            self.config.litellm.model = self.model_var.get().strip() or "whisper-1"
+            # Handle audio device - convert "default (device name)" back to "default"
+            audio_device = self.audio_device_var.get()
+            if audio_device.startswith("default (") and audio_device.endswith(")"):
+                audio_device = "default"
             
-            self.config.app.hotkey = self.hotkey_var.get()
+            # Update config object
+            litellm, app, ui = self.config.litellm, self.config.app, self.config.ui
+            litellm.api_key = api_key
+            litellm.api_base = api_base
+            litellm.key_alias = key_alias
+            litellm.model = self.model_var.get().strip() or "whisper-1"
             
-            # Handle audio device - convert "default (device name)" back to "default"
-            audio_device_selection = self.audio_device_var.get()
-            if audio_device_selection.startswith("default (") and audio_device_selection.endswith(")"):
-                self.config.app.audio_device = "default"
-            else:
-                self.config.app.audio_device = audio_device_selection
-                
-            self.config.app.sample_rate = int(self.sample_rate_var.get())
+            app.hotkey = self.hotkey_var.get()
+            app.audio_device = audio_device
+            app.sample_rate = sample_rate
             
-            self.config.ui.theme = self.theme_var.get()
-            self.config.ui.show_tray_notifications = self.notifications_var.get()
+            ui.theme = self.theme_var.get()
+            ui.show_tray_notifications = self.notifications_var.get()
             
             # Save configuration
             self.config_manager.save_config(self.config)
             
             # CRITICAL FIX: Update the audio recorder with new settings
             if self.audio_recorder:
-                self.logger.info(f"Updating audio recorder with new device: {self.config.app.audio_device}")
-                self.audio_recorder.device = self.config.app.audio_device if self.config.app.audio_device != "default" else None
-                self.audio_recorder.sample_rate = self.config.app.sample_rate
+                self.logger.info("Updating audio recorder with new device: %s", audio_device)
+                self.audio_recorder.device = audio_device if audio_device != "default" else None
+                self.audio_recorder.sample_rate = sample_rate
                 self.logger.info("Audio recorder settings updated successfully")
             
             messagebox.showinfo("Success", "Settings saved successfully! New microphone settings are now active.")
-            self._update_diagnostics_status()
+            self._update_diagnostics_status(force=True)
             
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save settings: {e}")
             
     def _cancel_settings(self):
         """Cancel changes and close window"""
-        self.hide()
+        # Same cleanup as the title-bar close (abandon requests, release sessions)
+        self._on_close()
         
     def _reset_to_defaults(self):
         """Reset settings to default values"""
         if messagebox.askyesno("Reset Settings", "Are you sure you want to reset all settings to defaults?"):
             try:
-                # Create default config
-                default_config = WindVoiceConfig()
-                
-                # Load defaults into form (except API keys)
-                self.hotkey_var.set(default_config.app.hotkey)
-                self.audio_device_var.set(default_config.app.audio_device)
-                self.sample_rate_var.set(str(default_config.app.sample_rate))
-                self.theme_var.set(default_config.ui.theme)
-                self.notifications_var.set(default_config.ui.show_tray_notifications)
+                # Load the dataclass field defaults into form (except API keys)
+                self.hotkey_var.set(AppConfig.hotkey)
+                self.audio_device_var.set(AppConfig.audio_device)
+                self.sample_rate_var.set(str(AppConfig.sample_rate))
+                self.theme_var.set(UIConfig.theme)
+                self.notifications_var.set(UIConfig.show_tray_notifications)
                 
                 messagebox.showinfo("Reset Complete", "Settings have been reset to defaults. Click 'Save Settings' to apply.")
                 
@@ -1274,20 +1350,58 @@ class SettingsWindow:
                 messagebox.showerror("Reset Error", f"Failed to reset settings: {e}")
                 
     def _on_theme_change(self, value):
-        """Handle theme change immediately"""
+        """Handle theme change, debounced so rapid selections repaint only once"""
+        if self._theme_after_id:
+            try:
+                self.window.after_cancel(self._theme_after_id)
+            except Exception:
+                pass
+        self._theme_after_id = self.window.after(150, self._apply_theme, value)
+        
+    def _apply_theme(self, value):
+        """Apply the selected appearance mode"""
+        self._theme_after_id = None
         try:
-            self.logger.info(f"Theme changed to: {value}")
+            # Skip the full restyle when navigation settles back on the active mode
+            if value.lower() == ctk.get_appearance_mode().lower():
+                return
+            self.logger.info("Theme changed to: %s", value)
             ctk.set_appearance_mode(value)
         except Exception as e:
-            self.logger.error(f"Error changing theme: {e}")
+            self.logger.error("Error changing theme: %s", e)
             
     def _on_close(self):
         """Handle window close event"""
+        # Abandon in-flight requests so no result arrives for a hidden window
+        if self._test_future is not None:
+            self._cancel_future(self._test_future)
+            self._test_future = None
+            self._reset_test_button()
+        if self._models_future is not None:
+            self._cancel_future(self._models_future)
+            self._models_future = None
+            self._reset_models_button()
+        
+        # Release cached HTTP sessions; they are rebuilt on the next Test / Load Models
+        if self._bg_loop is not None and self._svc_cache:
+            asyncio.run_coroutine_threadsafe(self._close_services(), self._bg_loop)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self.hide()
 
 
+# Shared settings window instance (widget tree is built once and reused)
+_settings_singleton: Optional[SettingsWindow] = None
+
+
 # Factory function for creating settings window
 def create_settings_window(config_manager: ConfigManager, 
-                         audio_recorder: Optional[AudioRecorder] = None) -> SettingsWindow:
-    """Create a new settings window instance"""
-    return SettingsWindow(config_manager, audio_recorder)
\ No newline at end of file
+                         audio_recorder: Optional["AudioRecorder"] = None) -> SettingsWindow:
+    """Show the shared settings window, creating it on first use"""
+    global _settings_singleton
+    if _settings_singleton is None:
+        _settings_singleton = SettingsWindow(config_manager, audio_recorder)
+    # show() reloads the saved settings when re-showing a hidden window
+    _settings_singleton.show()
+    return _settings_singleton
\ No newline at end of file
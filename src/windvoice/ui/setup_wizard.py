@@ -7,15 +7,93 @@ configuration.
 """
 
 import customtkinter as ctk
-import tkinter as tk
 from tkinter import messagebox
+import re
+import sys
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict
 
 from ..core.config import ConfigManager, WindVoiceConfig, LiteLLMConfig, AppConfig, UIConfig
+from ..utils.logging import get_logger
+
+# Credential format checks for the API step
+_API_KEY_RE = re.compile(r"sk-[A-Za-z0-9_\-]{8,}")
+_API_BASE_RE = re.compile(r"https?://[\w.\-:]+(/.*)?")
+
+# Printed when the wizard cannot be shown ({config_file} is filled in)
+_MANUAL_SETUP_GUIDANCE = """
+============================================================
+WINDVOICE-WINDOWS MANUAL SETUP REQUIRED
+============================================================
+The setup wizard could not be displayed. Please create the configuration manually:
+
+1. Create/edit the config file at: {config_file}
+
+2. Add the following content (replace with your actual credentials):
+
+[litellm]
+api_key = "sk-your-litellm-api-key"
+api_base = "https://your-litellm-proxy-url"
+key_alias = "your-username-or-id"
+model = "whisper-1"
+
+[app]
+hotkey = "ctrl+shift+space"
+sample_rate = 44100
+
+[ui]
+theme = "dark"
+window_position = "center"
+show_tray_notifications = true
+
+3. Save the file and restart WindVoice-Windows
+
+4. Contact your IT administrator for LiteLLM credentials if needed
+============================================================
+"""
+
+# Written to the config path when no config file exists yet
+_MANUAL_CONFIG_TEMPLATE = """# WindVoice-Windows Configuration
+# Please fill in your LiteLLM credentials below
+
+[litellm]
+api_key = ""  # Your LiteLLM API key (starts with sk-)
+api_base = ""  # Your LiteLLM proxy URL (https://your-proxy.com)
+key_alias = ""  # Your username or employee ID
+model = "whisper-1"
+
+[app]
+hotkey = "ctrl+shift+space"
+sample_rate = 44100
+
+[ui]
+theme = "dark"
+window_position = "center"
+show_tray_notifications = true
+"""
+
+# Appearance mode last applied by the wizard (CustomTkinter themes are process-wide)
+_applied_theme: Optional[str] = None
+
+
+def _apply_theme(theme: str):
+    """Apply an appearance mode, skipping the widget-wide restyle when it is already active"""
+    global _applied_theme
+    if theme == _applied_theme:
+        return
+    if _applied_theme is None:
+        ctk.set_default_color_theme("blue")
+    ctk.set_appearance_mode(theme)
+    _applied_theme = theme
 
 
 class SetupWizard:
+    # Credential entry width: 600px fixed-size window minus the main/form/entry padding
+    ENTRY_WIDTH = 480
+    
+    # Wizard steps in order, mapped to the method that builds each step's frame
+    STEP_BUILDERS = ("_build_welcome_frame", "_build_api_frame", "_build_preferences_frame")
+    
     def __init__(self, config_manager: ConfigManager, on_complete: Optional[Callable] = None):
         self.config_manager = config_manager
         self.on_complete = on_complete
@@ -24,16 +102,23 @@ class SetupWizard:
         self.window = None
         self.is_visible = False
         
-        # Form variables
-        self.api_key_var = None
-        self.api_base_var = None
-        self.key_alias_var = None
+        # Form state: entries/checkbox are read directly at submit time; the theme
+        # radio pair keeps a shared variable because the radio group needs one
+        self.api_key_entry = None
+        self.api_base_entry = None
+        self.key_alias_entry = None
+        self.notifications_check = None
         self.theme_var = None
-        self.notifications_var = None
+        
+        # Stripped API credentials, set once the API step passes validation
+        self._validated: Optional[Dict[str, str]] = None
         
         # Current step tracking
         self.current_step = 0
-        self.total_steps = 3
+        self.total_steps = len(self.STEP_BUILDERS)
+        
+        # Step frames, built on first visit and kept for Back/Next (see _show_step)
+        self._step_frames = {}
         
     def show(self):
         """Show the setup wizard"""
@@ -54,77 +139,121 @@ class SetupWizard:
     def _create_window(self):
         """Create the main setup window"""
         # Initialize variables
-        self.api_key_var = ctk.StringVar()
-        self.api_base_var = ctk.StringVar()
-        self.key_alias_var = ctk.StringVar()
         self.theme_var = ctk.StringVar(value="dark")
-        self.notifications_var = ctk.BooleanVar(value=True)
         
         self.window = ctk.CTkToplevel()
         self.window.title("WindVoice-Windows Setup")
-        self.window.geometry("600x700")
+        
+        # Size and center in one geometry call (screen size needs no idle flush)
+        x = (self.window.winfo_screenwidth() - 600) // 2
+        y = (self.window.winfo_screenheight() - 700) // 2
+        self.window.geometry(f"600x700+{x}+{y}")
         self.window.resizable(False, False)
         
-        # Make window modal
+        # Make window modal (once it is in place)
         self.window.transient()
         self.window.grab_set()
         
-        # Center the window
-        self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() // 2) - (600 // 2)
-        y = (self.window.winfo_screenheight() // 2) - (700 // 2)
-        self.window.geometry(f"+{x}+{y}")
-        
         # Prevent closing without completing setup
         self.window.protocol("WM_DELETE_WINDOW", self._on_close_attempt)
         
         # Set theme
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("blue")
+        _apply_theme("dark")
         
         # Create main container
         self.main_frame = ctk.CTkFrame(self.window)
         self.main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        self._create_welcome_step()
-        
-    def _create_welcome_step(self):
-        """Create the welcome step"""
-        self._clear_content()
-        self.current_step = 0
-        
-        # Progress indicator
         self._create_progress_indicator()
         
+        # Validation messages, shown above the current step (see _show_inline_error)
+        self._error_label = ctk.CTkLabel(self.main_frame, text="", text_color="red", wraplength=500)
+        self._error_after_id = None
+        
+        self._step_frames = {}
+        self._show_welcome_step()
+        
+    def _show_step(self, step: int):
+        """Swap the visible step frame, building it the first time it is shown"""
+        current = self._step_frames.get(self.current_step)
+        if current is not None:
+            current.pack_forget()
+        self._hide_inline_error()
+        
+        self.current_step = step
+        self._update_progress()
+        
+        frame = self._step_frames.get(step)
+        if frame is None:
+            frame = self._step_frames[step] = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+            getattr(self, self.STEP_BUILDERS[step])(frame)
+        frame.pack(fill="both", expand=True)
+        
+    def _show_inline_error(self, message: str, duration_ms: int = 4000):
+        """Show a validation message inside the wizard instead of a native dialog"""
+        self._error_label.configure(text=message)
+        if not self._error_label.winfo_ismapped():
+            self._error_label.pack(before=self._step_frames[self.current_step], pady=(0, 5))
+        if self._error_after_id is not None:
+            self.window.after_cancel(self._error_after_id)
+        self._error_after_id = self.window.after(duration_ms, self._hide_inline_error)
+        
+    def _hide_inline_error(self):
+        """Remove the validation message, if shown"""
+        if self._error_after_id is not None:
+            self.window.after_cancel(self._error_after_id)
+            self._error_after_id = None
+        self._error_label.pack_forget()
+        
+    def _show_welcome_step(self):
+        """Show the welcome step"""
+        self._show_step(0)
+        
+    def _show_api_step(self):
+        """Show the API configuration step"""
+        self._show_step(1)
+        
+    def _show_preferences_step(self):
+        """Show the preferences step"""
+        self._show_step(2)
+        
+    @staticmethod
+    def _font(size: Optional[int] = None, weight: str = "normal") -> tuple:
+        """Font spec in the theme's family; the wizard's text never changes font, so no CTkFont is needed"""
+        theme_font = ctk.ThemeManager.theme["CTkFont"]
+        return (theme_font["family"], size or theme_font["size"], weight)
+        
+    def _build_welcome_frame(self, frame):
+        """Build the welcome step widgets into its frame"""
         # Welcome content
         welcome_label = ctk.CTkLabel(
-            self.main_frame,
+            frame,
             text="Welcome to WindVoice-Windows! 🎙️",
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=self._font(size=28, weight="bold")
         )
         welcome_label.pack(pady=(40, 20))
         
         description = ctk.CTkLabel(
-            self.main_frame,
+            frame,
             text="Fast and accurate voice-to-text transcription for Windows\\n\\n"
                  "This setup wizard will help you configure:\\n"
                  "• Thomson Reuters LiteLLM API credentials\\n"
                  "• Basic application preferences\\n"
                  "• Audio device settings\\n\\n"
                  "Let's get started!",
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             justify="center"
         )
         description.pack(pady=20)
         
         # Feature highlights
-        features_frame = ctk.CTkFrame(self.main_frame)
+        features_frame = ctk.CTkFrame(frame)
         features_frame.pack(fill="x", pady=30, padx=40)
         
         features_title = ctk.CTkLabel(
             features_frame,
             text="✨ Key Features",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(size=16, weight="bold")
         )
         features_title.pack(pady=(15, 10))
         
@@ -135,103 +264,102 @@ class SetupWizard:
                  "🎯 Smart text injection into any Windows application\\n"
                  "🔒 Secure local configuration storage\\n"
                  "🎨 Modern, clean interface",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             justify="left"
         )
         features_text.pack(pady=(0, 15))
         
         # Next button
         next_button = ctk.CTkButton(
-            self.main_frame,
+            frame,
             text="Get Started →",
-            command=self._create_api_step,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            command=self._show_api_step,
+            font=self._font(size=14, weight="bold"),
             height=40,
             width=200
         )
         next_button.pack(pady=30)
         
-    def _create_api_step(self):
-        """Create the API configuration step"""
-        self._clear_content()
-        self.current_step = 1
-        
-        # Progress indicator
-        self._create_progress_indicator()
-        
+    def _build_api_frame(self, frame):
+        """Build the API configuration step widgets into its frame"""
         # Step title
         title_label = ctk.CTkLabel(
-            self.main_frame,
+            frame,
             text="Thomson Reuters LiteLLM Setup",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=self._font(size=22, weight="bold")
         )
         title_label.pack(pady=(20, 10))
         
         subtitle_label = ctk.CTkLabel(
-            self.main_frame,
+            frame,
             text="Configure your AI transcription credentials",
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             text_color="gray"
         )
         subtitle_label.pack(pady=(0, 20))
         
         # Form frame
-        form_frame = ctk.CTkFrame(self.main_frame)
+        form_frame = ctk.CTkFrame(frame)
         form_frame.pack(fill="x", padx=20, pady=10)
         
         # API Key
-        ctk.CTkLabel(form_frame, text="API Key *", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=20, pady=(20, 5))
+        ctk.CTkLabel(form_frame, text="API Key *", font=self._font(weight="bold")).pack(anchor="w", padx=20, pady=(20, 5))
         self.api_key_entry = ctk.CTkEntry(
             form_frame,
-            textvariable=self.api_key_var,
             placeholder_text="sk-your-virtual-api-key-here",
             show="*",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
+            width=self.ENTRY_WIDTH,
             height=35
         )
-        self.api_key_entry.pack(pady=(0, 10), padx=20, fill="x")
+        self.api_key_entry.pack(pady=(0, 10), padx=20)
+        
+        # The rest of the step is below the fold - paint it on the next idle tick
+        self.window.after_idle(self._build_api_frame_remainder, frame, form_frame)
         
+    def _build_api_frame_remainder(self, frame, form_frame):
+        """Build the API step widgets after the first credential field"""
         # API Base URL
-        ctk.CTkLabel(form_frame, text="API Base URL *", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=20, pady=(10, 5))
+        ctk.CTkLabel(form_frame, text="API Base URL *", font=self._font(weight="bold")).pack(anchor="w", padx=20, pady=(10, 5))
         self.api_base_entry = ctk.CTkEntry(
             form_frame,
-            textvariable=self.api_base_var,
             placeholder_text="https://your-litellm-proxy.company.com",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
+            width=self.ENTRY_WIDTH,
             height=35
         )
-        self.api_base_entry.pack(pady=(0, 10), padx=20, fill="x")
+        self.api_base_entry.pack(pady=(0, 10), padx=20)
         
         # Key Alias
-        ctk.CTkLabel(form_frame, text="User ID / Key Alias *", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=20, pady=(10, 5))
+        ctk.CTkLabel(form_frame, text="User ID / Key Alias *", font=self._font(weight="bold")).pack(anchor="w", padx=20, pady=(10, 5))
         self.key_alias_entry = ctk.CTkEntry(
             form_frame,
-            textvariable=self.key_alias_var,
             placeholder_text="your-username or employee-id",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
+            width=self.ENTRY_WIDTH,
             height=35
         )
-        self.key_alias_entry.pack(pady=(0, 20), padx=20, fill="x")
+        self.key_alias_entry.pack(pady=(0, 20), padx=20)
         
         # Help text
         help_text = ctk.CTkLabel(
-            self.main_frame,
+            frame,
             text="💡 Contact your IT administrator for these credentials\\n"
                  "🔒 Your credentials are stored locally and securely",
-            font=ctk.CTkFont(size=11),
+            font=self._font(size=11),
             text_color="gray",
             justify="center"
         )
         help_text.pack(pady=15)
         
         # Buttons
-        button_frame = ctk.CTkFrame(self.main_frame)
+        button_frame = ctk.CTkFrame(frame)
         button_frame.pack(fill="x", padx=20, pady=20)
         
         back_button = ctk.CTkButton(
             button_frame,
             text="← Back",
-            command=self._create_welcome_step,
+            command=self._show_welcome_step,
             width=100
         )
         back_button.pack(side="left", padx=20, pady=10)
@@ -244,36 +372,30 @@ class SetupWizard:
         )
         next_button.pack(side="right", padx=20, pady=10)
         
-    def _create_preferences_step(self):
-        """Create the preferences configuration step"""
-        self._clear_content()
-        self.current_step = 2
-        
-        # Progress indicator
-        self._create_progress_indicator()
-        
+    def _build_preferences_frame(self, frame):
+        """Build the preferences configuration step widgets into its frame"""
         # Step title
         title_label = ctk.CTkLabel(
-            self.main_frame,
+            frame,
             text="Application Preferences",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=self._font(size=22, weight="bold")
         )
         title_label.pack(pady=(20, 10))
         
         subtitle_label = ctk.CTkLabel(
-            self.main_frame,
+            frame,
             text="Customize your WindVoice experience",
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             text_color="gray"
         )
         subtitle_label.pack(pady=(0, 20))
         
         # Preferences frame
-        prefs_frame = ctk.CTkFrame(self.main_frame)
+        prefs_frame = ctk.CTkFrame(frame)
         prefs_frame.pack(fill="x", padx=20, pady=10)
         
         # Theme selection
-        ctk.CTkLabel(prefs_frame, text="Interface Theme", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=20, pady=(20, 5))
+        ctk.CTkLabel(prefs_frame, text="Interface Theme", font=self._font(weight="bold")).pack(anchor="w", padx=20, pady=(20, 5))
         theme_frame = ctk.CTkFrame(prefs_frame)
         theme_frame.pack(fill="x", padx=20, pady=(0, 15))
         
@@ -296,22 +418,22 @@ class SetupWizard:
         light_radio.pack(side="left", padx=20, pady=10)
         
         # Notifications
-        notifications_check = ctk.CTkCheckBox(
+        self.notifications_check = ctk.CTkCheckBox(
             prefs_frame,
             text="🔔 Show system tray notifications",
-            variable=self.notifications_var,
-            font=ctk.CTkFont(weight="bold")
+            font=self._font(weight="bold")
         )
-        notifications_check.pack(anchor="w", padx=20, pady=15)
+        self.notifications_check.select()
+        self.notifications_check.pack(anchor="w", padx=20, pady=15)
         
         # Quick setup info
-        info_frame = ctk.CTkFrame(self.main_frame)
+        info_frame = ctk.CTkFrame(frame)
         info_frame.pack(fill="x", padx=20, pady=15)
         
         info_title = ctk.CTkLabel(
             info_frame,
             text="🚀 Quick Setup Complete!",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(size=16, weight="bold")
         )
         info_title.pack(pady=(15, 5))
         
@@ -321,19 +443,19 @@ class SetupWizard:
                  "• Press Ctrl+Shift+Space anywhere to start recording\\n"
                  "• Right-click the system tray icon for advanced settings\\n"
                  "• Access audio device settings and more preferences",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             justify="left"
         )
         info_text.pack(pady=(0, 15))
         
         # Buttons
-        button_frame = ctk.CTkFrame(self.main_frame)
+        button_frame = ctk.CTkFrame(frame)
         button_frame.pack(fill="x", padx=20, pady=20)
         
         back_button = ctk.CTkButton(
             button_frame,
             text="← Back",
-            command=self._create_api_step,
+            command=self._show_api_step,
             width=100
         )
         back_button.pack(side="left", padx=20, pady=10)
@@ -343,115 +465,117 @@ class SetupWizard:
             text="Complete Setup ✅",
             command=self._finish_setup,
             width=150,
-            font=ctk.CTkFont(weight="bold")
+            font=self._font(weight="bold")
         )
         finish_button.pack(side="right", padx=20, pady=10)
         
     def _create_progress_indicator(self):
-        """Create progress indicator at top of window"""
+        """Create progress indicator at top of window (updated by _update_progress)"""
         progress_frame = ctk.CTkFrame(self.main_frame)
         progress_frame.pack(fill="x", pady=(10, 20))
         
-        progress_label = ctk.CTkLabel(
+        self.progress_label = ctk.CTkLabel(
             progress_frame,
-            text=f"Step {self.current_step + 1} of {self.total_steps}",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font(size=12, weight="bold")
         )
-        progress_label.pack(pady=10)
+        self.progress_label.pack(pady=10)
         
         # Progress bar
-        progress_value = (self.current_step + 1) / self.total_steps
-        progress_bar = ctk.CTkProgressBar(progress_frame, width=400)
-        progress_bar.pack(pady=(0, 10))
-        progress_bar.set(progress_value)
-        
-    def _clear_content(self):
-        """Clear all content from main frame"""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+        self.progress_bar = ctk.CTkProgressBar(progress_frame, width=400)
+        self.progress_bar.pack(pady=(0, 10))
+        
+    def _update_progress(self):
+        """Show the current step in the progress indicator"""
+        self.progress_label.configure(text=f"Step {self.current_step + 1} of {self.total_steps}")
+        self.progress_bar.set((self.current_step + 1) / self.total_steps)
             
     def _validate_api_and_continue(self):
         """Validate API configuration before continuing"""
-        api_key = self.api_key_var.get().strip()
-        api_base = self.api_base_var.get().strip()
-        key_alias = self.key_alias_var.get().strip()
-        
-        if not all([api_key, api_base, key_alias]):
-            messagebox.showwarning(
-                "Missing Information",
-                "Please fill in all required fields to continue."
-            )
+        api_key = self.api_key_entry.get().strip()
+        api_base = self.api_base_entry.get().strip()
+        key_alias = self.key_alias_entry.get().strip()
+        
+        if not (api_key and api_base and key_alias):
+            self._show_inline_error("Please fill in all required fields to continue.")
             return
             
         # Basic validation
-        if not api_key.startswith("sk-"):
-            messagebox.showwarning(
-                "Invalid API Key",
-                "API key should start with 'sk-'. Please check your credentials."
-            )
+        if not _API_KEY_RE.fullmatch(api_key):
+            self._show_inline_error("API key should start with 'sk-' followed by at least 8 letters, digits, '-' or '_'. Please check your credentials.")
             return
             
-        if not api_base.startswith("http"):
-            messagebox.showwarning(
-                "Invalid API Base URL", 
-                "API base URL should start with 'http://' or 'https://'"
-            )
+        if not _API_BASE_RE.fullmatch(api_base):
+            self._show_inline_error("API base URL should be a full 'http://' or 'https://' address")
             return
             
-        self._create_preferences_step()
+        self._validated = {"api_key": api_key, "api_base": api_base, "key_alias": key_alias}
+        self._show_preferences_step()
         
     def _on_theme_change(self):
         """Handle theme change"""
-        theme = self.theme_var.get()
-        ctk.set_appearance_mode(theme)
+        _apply_theme(self.theme_var.get())
         
     def _finish_setup(self):
         """Complete the setup and save configuration"""
         try:
             # Create configuration
             config = WindVoiceConfig(
-                litellm=LiteLLMConfig(
-                    api_key=self.api_key_var.get().strip(),
-                    api_base=self.api_base_var.get().strip(),
-                    key_alias=self.key_alias_var.get().strip(),
-                    model="whisper-1"
-                ),
+                litellm=LiteLLMConfig(**self._validated, model="whisper-1"),
                 app=AppConfig(),  # Use defaults
                 ui=UIConfig(
                     theme=self.theme_var.get(),
                     window_position="center",
-                    show_tray_notifications=self.notifications_var.get()
+                    show_tray_notifications=bool(self.notifications_check.get())
                 )
             )
             
-            # Save configuration
-            self.config_manager.save_config(config)
-            
-            # Mark setup as completed
-            self._mark_setup_completed()
-            
-            messagebox.showinfo(
-                "Setup Complete! 🎉",
-                "WindVoice-Windows has been configured successfully!\\n\\n"
-                "• Press Ctrl+Shift+Space to start voice recording\\n"
-                "• Right-click the system tray icon for settings\\n\\n"
-                "Welcome to fast voice-to-text transcription!"
-            )
-            
-            # Close wizard and notify completion
-            self.window.destroy()
-            self.is_visible = False
-            
-            if self.on_complete:
-                self.on_complete()
+            # Save configuration and mark setup as completed
+            self.config_manager.save_config(config, mark_completed=True)
                 
         except Exception as e:
-            messagebox.showerror("Setup Error", f"Failed to save configuration: {e}")
+            messagebox.showerror("Setup Error", f"Failed to save configuration: {e}", parent=self._dialog_parent())
+            return
+        
+        # Close wizard and notify completion right away; the confirmation closes itself.
+        # Kept out of the try above so their errors aren't reported as a failed save.
+        self.window.destroy()
+        self.is_visible = False
+        
+        if self.on_complete:
+            self.on_complete()
+        
+        self._show_success_toast()
+        
+    def _dialog_parent(self):
+        """Window to parent message boxes on, or None once the wizard window is gone"""
+        if self.window is not None and self.window.winfo_exists():
+            return self.window
+        return None
             
-    def _mark_setup_completed(self):
-        """Mark that initial setup has been completed"""
-        setup_marker = self.config_manager.config_dir / ".setup_completed"
-        setup_marker.touch()
+    def _show_success_toast(self, duration_ms: int = 2500):
+        """Show a non-modal 'setup complete' message that closes itself"""
+        toast = ctk.CTkToplevel()
+        toast.title("Setup Complete! 🎉")
+        toast.resizable(False, False)
+        toast.attributes("-topmost", True)
+        
+        ctk.CTkLabel(
+            toast,
+            text="WindVoice-Windows has been configured successfully!\n\n"
+                 "• Press Ctrl+Shift+Space to start voice recording\n"
+                 "• Right-click the system tray icon for settings\n\n"
+                 "Welcome to fast voice-to-text transcription!",
+            font=self._font(size=12),
+            justify="left"
+        ).pack(padx=20, pady=15)
+        
+        # Center on screen
+        toast.update_idletasks()
+        x = (toast.winfo_screenwidth() - toast.winfo_width()) // 2
+        y = (toast.winfo_screenheight() - toast.winfo_height()) // 2
+        toast.geometry(f"+{x}+{y}")
+        
+        toast.after(duration_ms, toast.destroy)
         
     def _on_close_attempt(self):
         """Handle attempt to close wizard before completion"""
@@ -459,7 +583,8 @@ class SetupWizard:
             "Exit Setup?",
             "WindVoice-Windows requires initial setup to function.\\n\\n"
             "Are you sure you want to exit without completing setup?\\n"
-            "The application will not work until configured."
+            "The application will not work until configured.",
+            parent=self._dialog_parent()
         )
         
         if result:
@@ -469,7 +594,7 @@ class SetupWizard:
 
 def is_setup_needed(config_manager: ConfigManager) -> bool:
     """Check if initial setup is needed"""
-    setup_marker = config_manager.config_dir / ".setup_completed"
+    setup_marker = config_manager.setup_marker_file
     config_file = config_manager.config_file
     
     # If setup marker exists, no setup needed
@@ -482,31 +607,23 @@ def is_setup_needed(config_manager: ConfigManager) -> bool:
         
     # If config file exists, check if it has valid credentials
     try:
-        config = config_manager.load_config()
-        # Check if API credentials are configured
-        if all([config.litellm.api_key, config.litellm.api_base, config.litellm.key_alias]):
-            # Valid config exists but no setup marker - create it automatically
-            print("Found valid configuration - marking setup as completed")
-            _mark_setup_completed_automatically(config_manager)
-            return False
-        else:
-            # Config exists but credentials are incomplete
-            return True
-    except Exception as e:
-        print(f"Error loading config: {e}")
+        litellm = config_manager.load_config().litellm
+    except Exception:
+        get_logger("setup_wizard").warning("Could not load config while checking setup state", exc_info=True)
         return True
-        
-    return True
-
-
-def _mark_setup_completed_automatically(config_manager: ConfigManager):
-    """Mark setup as completed automatically when valid config is found"""
+    
+    if not (litellm.api_key and litellm.api_base and litellm.key_alias):
+        # Config exists but credentials are incomplete
+        return True
+    
+    # Valid config exists but no setup marker - create it automatically
+    print("Found valid configuration - marking setup as completed")
     try:
-        setup_marker = config_manager.config_dir / ".setup_completed"
-        setup_marker.touch()
+        config_manager.mark_setup_completed()
         print(f"Setup completion marker created at: {setup_marker}")
-    except Exception as e:
+    except OSError as e:
         print(f"Warning: Could not create setup marker: {e}")
+    return False
 
 
 def run_setup_if_needed(config_manager: ConfigManager, on_complete: Optional[Callable] = None) -> bool:
@@ -531,55 +648,14 @@ def _provide_manual_setup_guidance(config_manager: ConfigManager):
     """Provide guidance for manual setup when GUI is not available"""
     config_file = config_manager.config_file
     
-    print("\n" + "="*60)
-    print("WINDVOICE-WINDOWS MANUAL SETUP REQUIRED")
-    print("="*60)
-    print("The setup wizard could not be displayed. Please create the configuration manually:")
-    print(f"\n1. Create/edit the config file at: {config_file}")
-    print("\n2. Add the following content (replace with your actual credentials):")
-    print("""
-[litellm]
-api_key = "sk-your-litellm-api-key"
-api_base = "https://your-litellm-proxy-url"
-key_alias = "your-username-or-id"
-model = "whisper-1"
-
-[app]
-hotkey = "ctrl+shift+space"
-sample_rate = 44100
-
-[ui]
-theme = "dark"
-window_position = "center"
-show_tray_notifications = true
-""")
-    print("3. Save the file and restart WindVoice-Windows")
-    print("\n4. Contact your IT administrator for LiteLLM credentials if needed")
-    print("="*60)
+    sys.stdout.write(_MANUAL_SETUP_GUIDANCE.format(config_file=config_file))
+    sys.stdout.flush()
     
     # Create example config if it doesn't exist
     try:
         if not config_file.exists():
             config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(config_file, 'w') as f:
-                f.write("""# WindVoice-Windows Configuration
-# Please fill in your LiteLLM credentials below
-
-[litellm]
-api_key = ""  # Your LiteLLM API key (starts with sk-)
-api_base = ""  # Your LiteLLM proxy URL (https://your-proxy.com)
-key_alias = ""  # Your username or employee ID
-model = "whisper-1"
-
-[app]
-hotkey = "ctrl+shift+space"
-sample_rate = 44100
-
-[ui]
-theme = "dark"
-window_position = "center"
-show_tray_notifications = true
-""")
+            config_file.write_text(_MANUAL_CONFIG_TEMPLATE, encoding="utf-8")
             print(f"Template configuration file created at: {config_file}")
     except Exception as e:
-        print(f"Could not create template config: {e}")
\ No newline at end of file
+        print(f"Could not create template config: {e}")
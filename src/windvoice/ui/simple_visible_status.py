@@ -2,32 +2,147 @@
 Simple, highly visible status feedback using multiple approaches
 """
 
+import ctypes
 import tkinter as tk
 from tkinter import messagebox
 import threading
-import time
-from typing import Optional
+import asyncio
+import queue
+from typing import NamedTuple, Optional
 from enum import Enum
 
+# pywin32 is optional; without it the cursor/screen are read through Tk
+try:
+    import win32api
+    import win32gui
+except ImportError:
+    win32api = win32gui = None
+
+# Toast backends for the console fallback, also optional; decided once at import
+try:
+    import win10toast
+except ImportError:
+    win10toast = None
+try:
+    from plyer import notification as plyer_notification
+except ImportError:
+    plyer_notification = None
+
 class StatusType(Enum):
     RECORDING = "recording"
     PROCESSING = "processing"
     SUCCESS = "success"
     ERROR = "error"
 
+# Hidden root created when no Tk root exists yet; kept for the life of the process
+_hidden_root: Optional[tk.Tk] = None
+
+def _get_root() -> tk.Tk:
+    """Return the default Tk root, creating (once) a hidden one if there is none"""
+    global _hidden_root
+    root = tk._default_root or _hidden_root
+    if root is None:
+        # A root made on a worker thread would tie Tk to that thread
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError(
+                "No Tk root exists yet; create the status window manager from the UI (main) thread first"
+            )
+        _hidden_root = root = tk.Tk()
+        root.withdraw()
+    return root
+
+# Created on first use: ToastNotifier registers a Win32 window class, so one is shared
+_toaster = None
+
+def _get_toaster():
+    """Return the shared win10toast notifier"""
+    global _toaster
+    if _toaster is None:
+        _toaster = win10toast.ToastNotifier()
+    return _toaster
+
+# win10toast's threaded mode starts a thread per toast; one worker shows them in turn instead
+_toast_queue: "queue.Queue[str]" = queue.Queue()
+_toast_worker: Optional[threading.Thread] = None
+
+def _queue_toast(message: str):
+    """Hand a toast message to the toast worker, starting it on first use"""
+    global _toast_worker
+    _toast_queue.put(message)
+    if _toast_worker is None:
+        _toast_worker = threading.Thread(target=_run_toast_worker, name="WindVoiceToast", daemon=True)
+        _toast_worker.start()
+
+def _run_toast_worker():
+    """Show queued toasts one at a time; messages that piled up meanwhile collapse to the latest"""
+    while True:
+        message = _toast_queue.get()
+        try:
+            while True:
+                message = _toast_queue.get_nowait()
+        except queue.Empty:
+            pass
+        
+        try:
+            _get_toaster().show_toast("WindVoice", message, duration=3, threaded=False)
+        except Exception as e:
+            print(f"Toast notification failed: {e}")
+
+class StateStyle(NamedTuple):
+    """Look of the status window for one status"""
+    bg: str
+    glow: str  # Border colour
+    message: str
+
+_STATE_STYLES = {
+    StatusType.RECORDING: StateStyle("#1a0000", "#ff6666", "🎤 RECORDING"),    # Dark red base
+    StatusType.PROCESSING: StateStyle("#00001a", "#6666ff", "⚡ PROCESSING"),  # Dark blue base
+    StatusType.SUCCESS: StateStyle("#001a00", "#66ff66", "✅ SUCCESS"),        # Dark green base
+    StatusType.ERROR: StateStyle("#1a0a00", "#ffaa66", "❌ ERROR"),            # Dark orange base
+}
+
+# Longer per-status messages for the console/toast fallback
+_CONSOLE_MESSAGES = {
+    StatusType.RECORDING: "🎤 RECORDING - Press hotkey to stop",
+    StatusType.PROCESSING: "⚡ PROCESSING - Transcribing audio...",
+    StatusType.SUCCESS: "✅ SUCCESS - Text inserted successfully",
+    StatusType.ERROR: "❌ ERROR - There was a problem with transcription"
+}
+
 class SimpleVisibleStatus:
     """
     Ultra-simple status feedback that guarantees visibility using multiple methods
     """
     
+    MESSAGE_TAG = "message"  # Canvas tag shared by the message text and its shadow
+    
+    # Window opacity at rest, under the mouse and while being dragged
+    ALPHA_IDLE = 0.5
+    ALPHA_HOVER = 0.65
+    ALPHA_DRAG = 0.85
+    
     def __init__(self):
+        # Resolve the Tk root now, on the constructing (UI) thread, so later calls never create one
+        _get_root()
+        
         self.current_window: Optional[tk.Toplevel] = None
         self.auto_hide_job: Optional[str] = None
+        self.visible = False  # The window is kept alive and withdrawn while hidden
+        self._alpha = self.ALPHA_IDLE  # Last opacity written to the window, to skip redundant writes
+        
+        # Widgets of the window, built once and restyled per status by _apply_state
+        self._canvas: Optional[tk.Canvas] = None
+        
+        # Display geometry, looked up once per show (reset in _show_simple_window)
+        self._monitor_rects: Optional[list] = None
+        self._primary_monitor: Optional[dict] = None
         
         # Dragging state
         self.dragging = False
-        self.drag_start_x = 0
+        self.drag_start_x = 0  # Pointer offset from the window's top-left corner
         self.drag_start_y = 0
+        self._drag_max_xy: Optional[tuple] = None  # Largest on-screen (x, y), read once per drag
+        self._last_drag_xy: Optional[tuple] = None
         
         # Position persistence
         self.custom_position = None  # (x, y) if user has moved the window
@@ -36,63 +151,113 @@ class SimpleVisibleStatus:
     def show_status(self, status_type: StatusType, duration: float = 3.0):
         """Show status with guaranteed visibility"""
         
-        # Hide any existing window
-        self.hide()
-        
         # Method 1: Simple Tkinter window with high visibility
         try:
-            self._show_simple_window(status_type, duration)
+            try:
+                self._show_simple_window(status_type, duration)
+            except tk.TclError:
+                # Window was destroyed behind our back - build a fresh one
+                self.destroy()
+                self._show_simple_window(status_type, duration)
         except Exception as e:
             print(f"Simple window failed: {e}")
             # Method 2: Fallback to console + system notification
             self._show_console_status(status_type)
             
     def _show_simple_window(self, status_type: StatusType, duration: float):
-        """Create a modern, transparent window near cursor"""
-        
-        # Create root if needed
-        try:
-            root = tk._default_root
-            if root is None:
-                root = tk.Tk()
-                root.withdraw()
-        except:
-            root = tk.Tk()
-            root.withdraw()
+        """Restyle the status window and bring it up near the cursor if hidden"""
+        self._ensure_window()
+        self._apply_state(status_type)
+        
+        if not self.visible:
+            # Display layout may have changed since the last show (resolution, DPI, monitors)
+            self._monitor_rects = None
+            self._primary_monitor = None
+            self._position_window()
+            # A hover/drag may have been cut short by the last hide
+            self._set_alpha(self.ALPHA_IDLE)
             
-        # Create visible toplevel window
-        self.current_window = tk.Toplevel(root)
+            # Force visibility WITHOUT stealing focus from active applications
+            self.current_window.deiconify()
+            self.current_window.lift()
+            # REMOVED: self.current_window.focus_force()  # This steals focus from text fields!
+            # Flush pending geometry/redraw only; update() would re-enter the event loop
+            # from inside whatever callback triggered this status change
+            self.current_window.update_idletasks()
+            self.visible = True
+        
+        self._schedule_auto_hide(duration)
+    
+    def _ensure_window(self):
+        """Create the modern, transparent status window once; later shows reuse it"""
+        if self.current_window is not None:
+            return
+        
+        # Create the toplevel window, kept withdrawn until it is first shown
+        self.current_window = tk.Toplevel(_get_root())
+        self.current_window.withdraw()
         
         # Configure for modern transparent appearance WITHOUT stealing focus
-        self.current_window.title("WindVoice Status")
-        self.current_window.geometry("160x80")  # More compact
-        self.current_window.attributes("-topmost", True)
-        self.current_window.attributes("-toolwindow", True)
-        self.current_window.attributes("-alpha", 0.5)  # Even more transparent
+        # (no title: it is never shown on an overrideredirect window; size and
+        # position are set together by _position_window before each show)
+        # All wm attributes in one call; alpha keeps it even more transparent
+        self.current_window.attributes("-topmost", True, "-toolwindow", True, "-alpha", self.ALPHA_IDLE)
+        self._alpha = self.ALPHA_IDLE
         self.current_window.resizable(False, False)
         self.current_window.overrideredirect(True)  # Remove window decorations
         
+        # Win32 styling is applied once per window, before it is first shown
+        self._apply_win32_styles()
+        
+        # Single canvas straight on the window; its highlight ring is the subtle border
+        self._canvas = tk.Canvas(
+            self.current_window,
+            highlightthickness=1,
+            relief='flat'
+        )
+        self._canvas.pack(fill='both', expand=True, padx=2, pady=2)
+        
+        # Add dragging functionality
+        self._canvas.bind("<Button-1>", self._on_drag_start)
+        self._canvas.bind("<B1-Motion>", self._on_drag_motion)
+        self._canvas.bind("<ButtonRelease-1>", self._on_drag_end)
+        
+        # Add hover effects for better interactivity
+        self._canvas.bind("<Enter>", self._on_hover_enter)
+        self._canvas.bind("<Leave>", self._on_hover_leave)
+        
+        # Modern text with shadow effect; both items share the MESSAGE_TAG so
+        # _apply_state updates them with a single itemconfigure
+        self._canvas.create_text(
+            81, 41,  # Shadow position (slightly offset)
+            font=('Segoe UI', 11, 'bold'),
+            fill="#000000",
+            anchor='center',
+            tags=self.MESSAGE_TAG
+        )
+        # Main text with glow effect
+        self._canvas.create_text(
+            80, 40,  # Main text position
+            font=('Segoe UI', 11, 'bold'),
+            fill="white",
+            anchor='center',
+            tags=self.MESSAGE_TAG
+        )
+    
+    def _apply_win32_styles(self):
+        """Make the window non-focusable and blurred behind (Windows only)"""
+        # Get window handle
+        hwnd = self.current_window.winfo_id()
+        
         # CRITICAL: Make window non-focusable to preserve text field focus
         try:
-            # Windows-specific: Make window non-focusable using Win32 API
-            import ctypes
-            from ctypes import wintypes
-            
-            # Get window handle
-            hwnd = self.current_window.winfo_id()
-            
             # Set WS_EX_NOACTIVATE extended style to prevent focus stealing
             GWL_EXSTYLE = -20
             WS_EX_NOACTIVATE = 0x08000000
             
-            # Get current extended style
-            current_style = ctypes.windll.user32.GetWindowLongPtrW(hwnd, GWL_EXSTYLE)
-            
-            # Add WS_EX_NOACTIVATE flag
-            new_style = current_style | WS_EX_NOACTIVATE
-            
-            # Apply new style
-            ctypes.windll.user32.SetWindowLongPtrW(hwnd, GWL_EXSTYLE, new_style)
+            user32 = ctypes.windll.user32
+            current_style = user32.GetWindowLongPtrW(hwnd, GWL_EXSTYLE)
+            user32.SetWindowLongPtrW(hwnd, GWL_EXSTYLE, current_style | WS_EX_NOACTIVATE)
             
             print("✅ Status dialog configured as non-focusable")
             
@@ -100,13 +265,22 @@ class SimpleVisibleStatus:
             print(f"⚠️ Warning: Could not make status window non-focusable: {e}")
             # Continue anyway - the dialog will work but may steal focus
         
+        # Add Windows blur effect if available
+        try:
+            ctypes.windll.dwmapi.DwmEnableBlurBehindWindow(hwnd, ctypes.byref(ctypes.c_int(1)))
+        except:
+            pass
+    
+    def _position_window(self):
+        """Place the window where the user left it, or next to the cursor"""
         # Position based on user preference or smart cursor placement
         window_width, window_height = 160, 80
         
         if self.user_moved_window and self.custom_position:
             # Use the custom position where user moved the window
             x, y = self.custom_position
-            # Ensure the custom position is still valid (in case screen resolution changed)
+            # Ensure the custom position is still valid (in case screen resolution changed);
+            # read live rather than from the cached _primary_monitor for that reason
             try:
                 screen_width = self.current_window.winfo_screenwidth()
                 screen_height = self.current_window.winfo_screenheight()
@@ -136,178 +310,88 @@ class SimpleVisibleStatus:
             y = max(monitor_info['top'], min(y, monitor_info['bottom'] - window_height))
         
         self.current_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+    
+    def _apply_state(self, status_type: StatusType):
+        """Restyle the existing window's widgets and canvas items for a status"""
+        style = _STATE_STYLES[status_type]
         
-        # Modern glassmorphism style based on status
-        if status_type == StatusType.RECORDING:
-            bg_color = "#1a0000"  # Dark red base
-            accent_color = "#ff4444"
-            text_color = "white"
-            message = "🎤 RECORDING"
-            glow_color = "#ff6666"
-        elif status_type == StatusType.PROCESSING:
-            bg_color = "#00001a"  # Dark blue base  
-            accent_color = "#4444ff"
-            text_color = "white"
-            message = "⚡ PROCESSING"
-            glow_color = "#6666ff"
-        elif status_type == StatusType.SUCCESS:
-            bg_color = "#001a00"  # Dark green base
-            accent_color = "#44ff44"
-            text_color = "white"
-            message = "✅ SUCCESS"
-            glow_color = "#66ff66"
-        else:  # ERROR
-            bg_color = "#1a0a00"  # Dark orange base
-            accent_color = "#ff8844"
-            text_color = "white"
-            message = "❌ ERROR"
-            glow_color = "#ffaa66"
-            
-        self.current_window.configure(bg=bg_color)
-        
-        # Add Windows blur effect if available
-        try:
-            import ctypes
-            hwnd = self.current_window.winfo_id()
-            ctypes.windll.dwmapi.DwmEnableBlurBehindWindow(hwnd, ctypes.byref(ctypes.c_int(1)))
-        except:
-            pass
-        
-        # Create main container frame with rounded appearance
-        main_frame = tk.Frame(
-            self.current_window,
-            bg=bg_color,
-            relief='flat',
-            bd=0
-        )
-        main_frame.pack(fill='both', expand=True, padx=2, pady=2)
-        
-        # Add subtle border effect with canvas
-        canvas = tk.Canvas(
-            main_frame,
-            bg=bg_color,
-            highlightthickness=1,
-            highlightbackground=glow_color,
-            relief='flat'
-        )
-        canvas.pack(fill='both', expand=True)
-        
-        # Add dragging functionality
-        canvas.bind("<Button-1>", self._on_drag_start)
-        canvas.bind("<B1-Motion>", self._on_drag_motion)
-        canvas.bind("<ButtonRelease-1>", self._on_drag_end)
-        main_frame.bind("<Button-1>", self._on_drag_start)
-        main_frame.bind("<B1-Motion>", self._on_drag_motion)
-        main_frame.bind("<ButtonRelease-1>", self._on_drag_end)
-        
-        # Add hover effects for better interactivity
-        canvas.bind("<Enter>", self._on_hover_enter)
-        canvas.bind("<Leave>", self._on_hover_leave)
-        
-        # Modern text with shadow effect
-        canvas.create_text(
-            81, 41,  # Shadow position (slightly offset)
-            text=message,
-            font=('Segoe UI', 11, 'bold'),
-            fill="#000000",
-            anchor='center'
-        )
-        
-        # Main text with glow effect
-        canvas.create_text(
-            80, 40,  # Main text position
-            text=message,
-            font=('Segoe UI', 11, 'bold'),
-            fill=text_color,
-            anchor='center'
-        )
-        
-        # Force visibility WITHOUT stealing focus from active applications
-        self.current_window.deiconify()
-        self.current_window.lift()
-        # REMOVED: self.current_window.focus_force()  # This steals focus from text fields!
-        self.current_window.update()
+        self.current_window.configure(bg=style.bg)
+        self._canvas.configure(bg=style.bg, highlightbackground=style.glow)
+        self._canvas.itemconfigure(self.MESSAGE_TAG, text=style.message)
+    
+    def _schedule_auto_hide(self, duration: float):
+        """(Re)start the auto-hide timer; a duration of 0 keeps the window up"""
+        self._cancel_auto_hide()
         
         # Auto-hide after duration using Tkinter's after method (thread-safe)
         if duration > 0:
-            def auto_hide():
-                try:
-                    if self.current_window:
-                        self.current_window.destroy()
-                        self.current_window = None
-                        self.auto_hide_job = None
-                except:
-                    pass
-                    
             # Convert duration to milliseconds and use Tkinter's after method
-            self.auto_hide_job = self.current_window.after(int(duration * 1000), auto_hide)
+            self.auto_hide_job = self.current_window.after(int(duration * 1000), self._auto_hide)
+    
+    def _cancel_auto_hide(self):
+        """Cancel any pending auto-hide"""
+        if self.auto_hide_job and self.current_window:
+            try:
+                self.current_window.after_cancel(self.auto_hide_job)
+            except:
+                pass
+        self.auto_hide_job = None
+    
+    def _auto_hide(self):
+        """Auto-hide timer callback"""
+        self.auto_hide_job = None
+        self.hide()
     
     def _get_cursor_position(self):
         """Get current cursor position"""
-        try:
-            import win32gui
+        if win32gui is not None:
             return win32gui.GetCursorPos()
-        except ImportError:
+        else:
             # Fallback using tkinter if win32gui not available
             try:
-                if self.current_window:
-                    self.current_window.update_idletasks()
-                    return self.current_window.winfo_pointerx(), self.current_window.winfo_pointery()
-                else:
-                    # Create temporary window to get pointer position
-                    temp_root = tk.Tk()
-                    temp_root.withdraw()
-                    temp_root.update_idletasks()
-                    x, y = temp_root.winfo_pointerx(), temp_root.winfo_pointery()
-                    temp_root.destroy()
-                    return x, y
+                widget = self.current_window or _get_root()
+                return widget.winfo_pointerx(), widget.winfo_pointery()
             except:
                 return 200, 200  # Default fallback position
     
     def _get_active_monitor(self, cursor_x, cursor_y):
         """Get information about the monitor containing the cursor"""
-        try:
-            import win32api
-            
-            # Get all monitors
-            monitors = win32api.EnumDisplayMonitors()
-            
-            # Find monitor containing cursor
-            for monitor_handle, device_context, monitor_rect in monitors:
-                left, top, right, bottom = monitor_rect
-                if left <= cursor_x < right and top <= cursor_y < bottom:
-                    return {
-                        'left': left,
-                        'top': top,
-                        'right': right,
-                        'bottom': bottom,
-                        'width': right - left,
-                        'height': bottom - top
-                    }
-            
-            # Fallback to primary monitor if cursor monitor not found
-            return self._get_primary_monitor()
-            
-        except ImportError:
+        if win32api is None:
             return self._get_primary_monitor()
+        
+        monitor = self._find_monitor(cursor_x, cursor_y)
+        
+        # Fallback to primary monitor if cursor monitor not found
+        return monitor or self._get_primary_monitor()
+    
+    def _find_monitor(self, cursor_x, cursor_y) -> Optional[dict]:
+        """Find the cached monitor rect containing the cursor, enumerating monitors if needed"""
+        if self._monitor_rects is None:
+            self._monitor_rects = [monitor_rect for _handle, _dc, monitor_rect in win32api.EnumDisplayMonitors()]
+        
+        for left, top, right, bottom in self._monitor_rects:
+            if left <= cursor_x < right and top <= cursor_y < bottom:
+                return {
+                    'left': left,
+                    'top': top,
+                    'right': right,
+                    'bottom': bottom,
+                    'width': right - left,
+                    'height': bottom - top
+                }
+        return None
     
     def _get_primary_monitor(self):
-        """Get primary monitor information as fallback"""
+        """Get primary monitor information as fallback (cached after the first lookup)"""
+        if self._primary_monitor is not None:
+            return self._primary_monitor
+        
         try:
-            if self.current_window:
-                self.current_window.update_idletasks()
-                width = self.current_window.winfo_screenwidth()
-                height = self.current_window.winfo_screenheight()
-            else:
-                # Create temporary window to get screen dimensions
-                temp_root = tk.Tk()
-                temp_root.withdraw()
-                temp_root.update_idletasks()
-                width = temp_root.winfo_screenwidth()
-                height = temp_root.winfo_screenheight()
-                temp_root.destroy()
-                
-            return {
+            widget = self.current_window or _get_root()
+            width = widget.winfo_screenwidth()
+            height = widget.winfo_screenheight()
+            
+            self._primary_monitor = {
                 'left': 0,
                 'top': 0,
                 'right': width,
@@ -315,6 +399,7 @@ class SimpleVisibleStatus:
                 'width': width,
                 'height': height
             }
+            return self._primary_monitor
         except:
             return {
                 'left': 0, 'top': 0, 'right': 1920, 'bottom': 1080,
@@ -324,14 +409,27 @@ class SimpleVisibleStatus:
     def _on_drag_start(self, event):
         """Start dragging the window WITHOUT stealing focus"""
         self.dragging = True
-        self.drag_start_x = event.x
-        self.drag_start_y = event.y
         
         # Change cursor to indicate dragging
         if self.current_window:
+            # Read geometry once here so motion events don't query Tk for it each time
+            window_x = self.current_window.winfo_x()
+            window_y = self.current_window.winfo_y()
+            self.drag_start_x = event.x_root - window_x
+            self.drag_start_y = event.y_root - window_y
+            self._last_drag_xy = (window_x, window_y)
+            try:
+                self._drag_max_xy = (
+                    self.current_window.winfo_screenwidth() - self.current_window.winfo_width(),
+                    self.current_window.winfo_screenheight() - self.current_window.winfo_height()
+                )
+            except:
+                # If screen bounds check fails, still allow basic movement
+                self._drag_max_xy = None
+            
             self.current_window.configure(cursor="fleur")
             # Slightly increase opacity when dragging
-            self.current_window.attributes("-alpha", min(0.85, self.current_window.attributes("-alpha") + 0.2))
+            self._set_alpha(self.ALPHA_DRAG)
             
             # IMPORTANT: Don't focus the window during drag operations
             # This preserves focus in the original text field
@@ -340,24 +438,18 @@ class SimpleVisibleStatus:
         """Handle window dragging with smooth movement"""
         if self.current_window and self.dragging:
             # Calculate new position
-            new_x = self.current_window.winfo_x() + (event.x - self.drag_start_x)
-            new_y = self.current_window.winfo_y() + (event.y - self.drag_start_y)
+            new_x = event.x_root - self.drag_start_x
+            new_y = event.y_root - self.drag_start_y
             
             # Keep window within screen bounds
-            try:
-                screen_width = self.current_window.winfo_screenwidth()
-                screen_height = self.current_window.winfo_screenheight()
-                window_width = self.current_window.winfo_width()
-                window_height = self.current_window.winfo_height()
-                
-                # Constrain to screen bounds
-                new_x = max(0, min(new_x, screen_width - window_width))
-                new_y = max(0, min(new_y, screen_height - window_height))
-                
-                # Apply new position
-                self.current_window.geometry(f"+{new_x}+{new_y}")
-            except:
-                # If screen bounds check fails, still allow basic movement
+            if self._drag_max_xy:
+                max_x, max_y = self._drag_max_xy
+                new_x = max(0, min(new_x, max_x))
+                new_y = max(0, min(new_y, max_y))
+            
+            # Apply new position, skipping moves that land on the same pixel
+            if (new_x, new_y) != self._last_drag_xy:
+                self._last_drag_xy = (new_x, new_y)
                 self.current_window.geometry(f"+{new_x}+{new_y}")
     
     def _on_drag_end(self, event):
@@ -379,97 +471,121 @@ class SimpleVisibleStatus:
             # Restore cursor and transparency
             self.current_window.configure(cursor="")
             # Restore original transparency
-            self.current_window.attributes("-alpha", 0.5)
+            self._set_alpha(self.ALPHA_IDLE)
     
     def _on_hover_enter(self, event):
         """Handle mouse hover enter - increase visibility slightly"""
         if self.current_window and not self.dragging:
             # Slightly increase opacity on hover for better interaction
-            self.current_window.attributes("-alpha", min(0.8, self.current_window.attributes("-alpha") + 0.15))
+            self._set_alpha(self.ALPHA_HOVER)
     
     def _on_hover_leave(self, event):
         """Handle mouse hover leave - restore transparency"""
         if self.current_window and not self.dragging:
             # Restore original transparency
-            self.current_window.attributes("-alpha", 0.5)
+            self._set_alpha(self.ALPHA_IDLE)
+    
+    def _set_alpha(self, alpha: float):
+        """Set window opacity, skipping the Tk call when it is unchanged"""
+        if alpha != self._alpha:
+            self._alpha = alpha
+            self.current_window.attributes("-alpha", alpha)
         
         
     def _show_console_status(self, status_type: StatusType):
         """Fallback: show status in console with system notification"""
         
-        messages = {
-            StatusType.RECORDING: "🎤 RECORDING - Press hotkey to stop",
-            StatusType.PROCESSING: "⚡ PROCESSING - Transcribing audio...",
-            StatusType.SUCCESS: "✅ SUCCESS - Text inserted successfully",
-            StatusType.ERROR: "❌ ERROR - There was a problem with transcription"
-        }
-        
-        message = messages.get(status_type, "Status update")
+        message = _CONSOLE_MESSAGES.get(status_type, "Status update")
         print(f"\n{'='*50}")
         print(f"WINDVOICE STATUS: {message}")
         print(f"{'='*50}\n")
         
         # Try Windows toast notification
-        try:
-            import win10toast
-            toaster = win10toast.ToastNotifier()
-            toaster.show_toast(
-                "WindVoice",
-                message,
-                duration=3,
-                threaded=True
-            )
-        except ImportError:
+        if win10toast is not None:
+            _queue_toast(message)
+        elif plyer_notification is not None:
             # Try plyer as alternative
-            try:
-                from plyer import notification
-                notification.notify(
-                    title="WindVoice",
-                    message=message,
-                    timeout=3
-                )
-            except ImportError:
-                print("No notification system available - status shown in console only")
+            plyer_notification.notify(
+                title="WindVoice",
+                message=message,
+                timeout=3
+            )
+        else:
+            print("No notification system available - status shown in console only")
                 
     def hide(self):
-        """Hide current status window"""
-        # Cancel any pending auto-hide
-        if self.auto_hide_job and self.current_window:
+        """Hide current status window (withdrawn, not destroyed, so it can be reused)"""
+        self._cancel_auto_hide()
+        
+        if self.current_window and self.visible:
             try:
-                self.current_window.after_cancel(self.auto_hide_job)
-                self.auto_hide_job = None
+                self.current_window.withdraw()
             except:
                 pass
-                
-        # Destroy window
+        self.visible = False
+    
+    def destroy(self):
+        """Destroy the status window; used on shutdown"""
+        self._cancel_auto_hide()
+        self.visible = False
+        
         if self.current_window:
             try:
                 self.current_window.destroy()
             except:
                 pass
             self.current_window = None
+            self._canvas = None
 
 class SimpleVisibleStatusManager:
-    """Manager for simple visible status"""
+    """Manager for simple visible status
+    
+    Must be called from the Tk thread; other threads schedule calls with root.after(0, ...).
+    """
+    
+    # State changes are held this long so back-to-back transitions render only the latest
+    DEBOUNCE_MS = 50
     
     def __init__(self):
         self.status = SimpleVisibleStatus()
+        self._pending_state: Optional[tuple] = None  # (StatusType, duration) awaiting _flush
+        self._pending_job: Optional[str] = None
         
     def show_recording(self):
         """Show recording status"""
-        self.status.show_status(StatusType.RECORDING, 0)  # Show indefinitely
+        self._request_state(StatusType.RECORDING, 0)  # Show indefinitely
         
     def show_processing(self):
         """Show processing status"""  
-        self.status.show_status(StatusType.PROCESSING, 0)  # Show indefinitely
+        self._request_state(StatusType.PROCESSING, 0)  # Show indefinitely
         
     def show_success(self):
         """Show success status"""
-        self.status.show_status(StatusType.SUCCESS, 2.0)  # Auto-hide after 2 seconds
+        self._request_state(StatusType.SUCCESS, 2.0)  # Auto-hide after 2 seconds
         
     def show_error(self):
         """Show error status"""
-        self.status.show_status(StatusType.ERROR, 3.0)  # Auto-hide after 3 seconds
+        self._request_state(StatusType.ERROR, 3.0)  # Auto-hide after 3 seconds
+        
+    def _request_state(self, status_type: StatusType, duration: float):
+        """Queue a status; a newer request within DEBOUNCE_MS replaces it"""
+        self._pending_state = (status_type, duration)
+        if self._pending_job is not None:
+            return
+        
+        root = tk._default_root
+        if root is None:
+            # No Tk loop to defer on yet - show it right away
+            self._flush()
+        else:
+            self._pending_job = root.after(self.DEBOUNCE_MS, self._flush)
+            
+    def _flush(self):
+        """Show the latest requested status"""
+        self._pending_job = None
+        pending, self._pending_state = self._pending_state, None
+        if pending is not None:
+            self.status.show_status(*pending)
         
     def update_audio_level(self, level: float):
         """Update audio level (not implemented for simple version)"""
@@ -477,11 +593,26 @@ class SimpleVisibleStatusManager:
         
     def hide(self):
         """Hide status"""
+        self._pending_state = None  # Drop any status still waiting to be shown
         self.status.hide()
         
+    def destroy(self):
+        """Destroy the status window (on shutdown)"""
+        self._pending_state = None
+        self.status.destroy()
+        
     def is_visible(self) -> bool:
         """Check if status is visible"""
-        return self.status.current_window is not None
+        return self.status.visible
+
+
+async def _tk_tick(interval: float = 1 / 60):
+    """Pump Tk events from asyncio so windows stay responsive while coroutines sleep"""
+    while True:
+        root = tk._default_root
+        if root is not None:
+            root.update()
+        await asyncio.sleep(interval)
 
 
 # Test function
@@ -491,26 +622,33 @@ def test_simple_visible():
     
     manager = SimpleVisibleStatusManager()
     
-    def test_sequence():
+    async def test_sequence():
         print("1. Testing RECORDING...")
         manager.show_recording()
-        time.sleep(3)
+        await asyncio.sleep(3)
         
         print("2. Testing PROCESSING...")
         manager.show_processing()
-        time.sleep(3)
+        await asyncio.sleep(3)
         
         print("3. Testing SUCCESS...")
         manager.show_success()
-        time.sleep(3)
+        await asyncio.sleep(3)
         
         print("4. Testing ERROR...")
         manager.show_error()
-        time.sleep(4)
+        await asyncio.sleep(4)
         
         print("Test completed!")
         
-    test_sequence()
+    async def main():
+        tick = asyncio.ensure_future(_tk_tick())
+        try:
+            await test_sequence()
+        finally:
+            tick.cancel()
+        
+    asyncio.run(main())
 
 if __name__ == "__main__":
     test_simple_visible()
\ No newline at end of file